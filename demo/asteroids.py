@@ -16,12 +16,20 @@ main = Scene()
 # background
 stars = Surface(size, size)
 stars.fill(Color.black)
-for _ in range(200):
-    pos = (
-        random.randint(-half_size, half_size),
-        random.randint(-half_size, half_size),
-    )
-    stars.set_pixel(pos, Color.white)
+stars.set_pixels(
+    [(random.randint(-half_size, half_size), random.randint(-half_size, half_size)) for _ in range(200)],
+    Color.white,
+)
+
+
+# gameobjects that wrap around the screen edges, swept once per frame by check_bounds
+bounded: set[GameObject] = set()
+
+
+# every gameobject the demo removes goes through here, so that the sweep never moves a removed one
+def remove(*gos: GameObject):
+    main.remove(*gos)
+    bounded.difference_update(gos)
 
 
 class Timer(Component):
@@ -31,7 +39,7 @@ class Timer(Component):
         self.secs = secs
 
     def remove(self):
-        main.remove(self.gameobj)
+        remove(self.gameobj)
 
     def setup(self):
         Time.delayed_call(self.remove, self.secs)
@@ -44,9 +52,9 @@ expl.draw_rect((0, 0), expl.size(), Color.debug, 3)
 
 def make_part(angle: float):
     return Particle(
-        expl.clone(),
-        pos=Particle.circle_shape(radius * 0.75)(angle),
-        velocity=Particle.circle_direction()(angle) * random.randint(50, 100),
+        expl,
+        pos=Vector.from_radial(radius * 0.75, angle),
+        velocity=Vector.from_radial(random.randint(50, 100), angle),
         rotation=random.randint(0, 360),
     )
 
@@ -58,18 +66,34 @@ expl_sys = wrap([
 ])
 
 
-# component to move things that are out of bounds
+# component to mark things that should wrap around when out of bounds
 class BoundsChecker(Component):
 
-    def update(self):
-        if self.gameobj.pos.x < Display.left - radius:
-            self.gameobj.pos.x = Display.right + radius
-        elif self.gameobj.pos.x > Display.right + radius:
-            self.gameobj.pos.x = Display.left - radius
-        if self.gameobj.pos.y > Display.top + radius:
-            self.gameobj.pos.y = Display.bottom - radius
-        elif self.gameobj.pos.y < Display.bottom - radius:
-            self.gameobj.pos.y = Display.top + radius
+    def setup(self):
+        bounded.add(self.gameobj)
+
+
+# moves every bounded object that is out of bounds in a single pass
+def check_bounds():
+    left, right = Display.left - radius, Display.right + radius
+    bottom, top = Display.bottom - radius, Display.top + radius
+    for go in bounded:
+        pos = go.pos
+        if pos.x < left:
+            pos.x = right
+        elif pos.x > right:
+            pos.x = left
+        if pos.y > top:
+            pos.y = bottom
+        elif pos.y < bottom:
+            pos.y = top
+
+
+main.update = check_bounds
+
+
+# unit directions of each asteroid vertex, precomputed for every possible number of sides
+asteroid_dirs = {sides: [Vector.from_radial(1, -i * 360 / sides) for i in range(sides)] for sides in range(5, 9)}
 
 
 # asteroid generator
@@ -90,16 +114,9 @@ def make_asteroid():
         wrap(
             [
                 Polygon(
-                    [
-                        Vector.from_radial(
-                            random.randint(
-                                int(radius * .7),
-                                int(radius * 0.95),
-                            ),
-                            -i * 360 / sides,
-                        ) for i in range(sides)
-                    ],
+                    [d * random.randint(int(radius * .7), int(radius * 0.95)) for d in asteroid_dirs[sides]],
                     debug=True,
+                    tag="asteroid",
                 ),
                 RigidBody(
                     velocity=direction * 100,
@@ -117,6 +134,12 @@ def make_asteroid():
 Time.schedule(RecurrentTask(make_asteroid, 1, 1))
 
 
+def steer(vx: float, vy: float, dx: float, dy: float, speed: float, max_steer: float) -> tuple[float, float]:
+    """Steers the velocity (vx, vy) towards the direction (dx, dy) using plain floats."""
+    svx, svy = Vector.clamp_magnitude_xy(dx * speed - vx, dy * speed - vy, max_steer)
+    return Vector.clamp_magnitude_xy(vx + svx, vy + svy, speed)
+
+
 class PlayerController(Component):
 
     def setup(self):
@@ -142,6 +165,8 @@ class PlayerController(Component):
                             radius // 5,
                             Color.debug,
                             trigger=True,
+                            tag="bullet",
+                            should_collide=bullet_should_collide,
                             on_collide=bullet_collide,
                         ),
                         RigidBody(
@@ -154,7 +179,7 @@ class PlayerController(Component):
                         BoundsChecker(),
                         Timer(0.75),
                     ],
-                    pos=self.gameobj.pos,
+                    pos=self.gameobj.pos.clone(),
                     rotation=self.gameobj.rotation,
                     name="bullet",
                 )
@@ -174,16 +199,13 @@ class PlayerController(Component):
             (-1 if Input.key_pressed("a") or Input.key_pressed("left") else (1 if Input.key_pressed("d") or Input.key_pressed("right") else 0))
         dy = c_axis_1 or \
             (1 if Input.key_pressed("w") or Input.key_pressed("up") else (-1 if Input.key_pressed("s") or Input.key_pressed("down") else 0))
-        target = Vector(dx, dy)
-
-        d_vel = target * self.speed
-        steering = Vector.clamp_magnitude(d_vel - self.velocity, self.steer)
-
-        self.velocity = Vector.clamp_magnitude(self.velocity + steering, self.speed)
+        vx, vy = steer(self.velocity.x, self.velocity.y, dx, dy, self.speed, self.steer)
+        self.velocity.x, self.velocity.y = vx, vy
 
-        self.gameobj.pos += self.velocity * Time.fixed_delta
+        pos = self.gameobj.pos
+        self.gameobj.pos = Vector(pos.x + vx * Time.fixed_delta, pos.y + vy * Time.fixed_delta)
 
-        if target != (0, 0):
+        if dx or dy:
             self.gameobj.rotation = self.velocity.angle
 
 
@@ -213,8 +235,13 @@ main.add(
 )
 
 
+# bullets only ever hit asteroids, so skip the narrow phase against anything else
+def bullet_should_collide(_, other: Hitbox):
+    return other.tag == "asteroid"
+
+
 def bullet_collide(man: Manifold):
-    if man.shape_b.gameobj.name == "asteroid":
+    if man.shape_b.tag == "asteroid":
         local_expl = expl_sys.clone()
         local_expl.pos = man.shape_b.gameobj.pos.clone()
         local_expl.rotation = random.randint(0, 360)
@@ -222,8 +249,7 @@ def bullet_collide(man: Manifold):
         if isinstance(man.shape_b, Polygon):
             local_expl_sys.spread = 360 / len(man.shape_b.verts)
         local_expl_sys.start()
-        main.remove(man.shape_b.gameobj)
-        main.remove(man.shape_a.gameobj)
+        remove(man.shape_b.gameobj, man.shape_a.gameobj)
         main.add(local_expl)
 
 
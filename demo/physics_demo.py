@@ -56,54 +56,52 @@ def should_collide(a, b):
     return a.tag == "" or b.tag == "" or a.tag == b.tag
 
 
-# Create and add all our objects
-for _ in range(num_obj // 2):
-    main_scene.add(
-        rb.wrap(
-            [
-                rb.Circle(
-                    radius=rb.Display.res.x // num_obj,
-                    color=rb.Color.random_default(),
-                    tag="circle",
-                    should_collide=should_collide,
-                ),
-                rb.RigidBody(
-                    mass=0.1,
-                    bounciness=0.99,
-                    friction=0.2,
-                    gravity=(0, -80),
-                    velocity=(randint(-100, 100), randint(-100, 100)),
-                ),
-            ],
-            pos=rb.Display.top_left + (
-                randint(int(rb.Display.res.x / 20), int(19 * rb.Display.res.x / 20)),
-                -randint(int(rb.Display.res.y / 20), int(19 * rb.Display.res.y / 20)),
-            ),
-        )
-    )
-for _ in range(num_obj // 2):
-    main_scene.add(
-        rb.wrap(
-            [
-                rb.Polygon(
-                    rb.Vector.poly(randint(3, 9), rb.Display.res.x // num_obj),
-                    color=rb.Color.random_default(),
-                    tag="not_circle",
-                    should_collide=should_collide,
-                ),
-                rb.RigidBody(
-                    mass=0.1,
-                    bounciness=0.99,
-                    friction=0.2,
-                    gravity=(0, -80),
-                    velocity=(randint(-100, 100), randint(-100, 100)),
-                ),
-            ],
-            pos=rb.Display.top_left + (
-                randint(int(rb.Display.res.x / 20), int(19 * rb.Display.res.x / 20)),
-                -randint(int(rb.Display.res.y / 20), int(19 * rb.Display.res.y / 20)),
+# Spawn bounds and object size only need to be computed once
+res = rb.Display.res
+top_left = rb.Display.top_left
+size = res.x // num_obj
+min_x, max_x = int(res.x / 20), int(19 * res.x / 20)
+min_y, max_y = int(res.y / 20), int(19 * res.y / 20)
+
+
+def make_obj(hitbox: rb.Hitbox) -> rb.GameObject:
+    return rb.wrap(
+        [
+            hitbox,
+            rb.RigidBody(
+                mass=0.1,
+                bounciness=0.99,
+                friction=0.2,
+                gravity=(0, -80),
+                velocity=(randint(-100, 100), randint(-100, 100)),
             ),
-        )
+        ],
+        pos=top_left + (randint(min_x, max_x), -randint(min_y, max_y)),
     )
 
+
+# Create all our objects and add them in one call
+main_scene.add(
+    *(
+        make_obj(
+            rb.Circle(
+                radius=size,
+                color=rb.Color.random_default(),
+                tag="circle",
+                should_collide=should_collide,
+            )
+        ) for _ in range(num_obj // 2)
+    ),
+    *(
+        make_obj(
+            rb.Polygon(
+                rb.Vector.poly(randint(3, 9), size),
+                color=rb.Color.random_default(),
+                tag="not_circle",
+                should_collide=should_collide,
+            )
+        ) for _ in range(num_obj // 2)
+    ),
+)
+
 rb.begin()
@@ -80,6 +80,10 @@ def init(
 
     Display.window = sdl2.ext.Window(name, (int(size[0]), int(size[1])), window_pos, flags)
 
+    # let SDL merge consecutive texture copies into as few GPU submissions as possible,
+    # even when a specific render driver was requested (which otherwise turns batching off)
+    sdl2.SDL_SetHint(sdl2.SDL_HINT_RENDER_BATCHING, b"1")
+
     Display.renderer = sdl2.ext.Renderer(
         Display.window,
         flags=(sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_TARGETTEXTURE),
@@ -103,6 +107,7 @@ def init(
     Display.hidden = hidden
 
     Game.debug_font = Font(size=22, font="Mozart", color=Color.debug)
+    Draw._prewarm()
 
     sdl2.SDL_JoystickEventState(sdl2.SDL_ENABLE)
 
@@ -11,6 +11,8 @@ else:
     cdraw: Any
     import array
 
+_int_array_template: array.array = array.array("i", [])
+
 
 def create_pixel_buffer(width: int, height: int) -> int:
     return cdraw.createPixelBuffer(width, height)
@@ -32,6 +34,29 @@ def set_pixel(pixels: int, width: int, height: int, x: int, y: int, color: int,
     cdraw.setPixel(pixels, width, height, x, y, color, blending)
 
 
+def set_pixels(
+    pixels: int,
+    width: int,
+    height: int,
+    xs: list[int],
+    ys: list[int],
+    color: int,
+    blending: bool = True,
+):
+    vx: array.array = array.array("i", xs)
+    vy: array.array = array.array("i", ys)
+    cdraw.setPixels(
+        pixels,
+        width,
+        height,
+        vx.data.as_voidptr,  # type: ignore
+        vy.data.as_voidptr,  # type: ignore
+        min(len(xs), len(ys)),
+        color,
+        blending,
+    )
+
+
 def get_pixel(pixels: int, width: int, height: int, x: int, y: int):
     return cdraw.getPixel(pixels, width, height, x, y)
 
@@ -134,25 +159,44 @@ def draw_poly(
     aa: bool = False,
     blending: bool = True,
     thickness: int = 1,
-):
-    vxt = []
-    vyt = []
-    for v in points:
-        x, y = round(v[0] + center[0]), round(center[1] - v[1])
-        vxt.append(x)
-        vyt.append(y)
-    vx: array.array = array.array("i", vxt)
-    vy: array.array = array.array("i", vyt)
+) -> tuple[int, int, int, int]:
+    n: cython.int = len(points)
+    vx: array.array = array.clone(_int_array_template, n, False)
+    vy: array.array = array.clone(_int_array_template, n, False)
+    cx: cython.double = center[0]
+    cy: cython.double = center[1]
+    i: cython.int
+    x: cython.int
+    y: cython.int
+    min_x: cython.int = 0
+    min_y: cython.int = 0
+    max_x: cython.int = 0
+    max_y: cython.int = 0
+    for i in range(n):
+        v = points[i]
+        x = round(v[0] + cx)
+        y = round(cy - v[1])
+        vx.data.as_ints[i] = x  # type: ignore
+        vy.data.as_ints[i] = y  # type: ignore
+        if i == 0 or x < min_x:
+            min_x = x
+        if i == 0 or x > max_x:
+            max_x = x
+        if i == 0 or y < min_y:
+            min_y = y
+        if i == 0 or y > max_y:
+            max_y = y
     cdraw.drawPoly(
         pixels,
         width,
         height,
         vx.data.as_voidptr,  # type: ignore
         vy.data.as_voidptr,  # type: ignore
-        len(points),
+        n,
         border_color,
         fill_color,
         aa,
         blending,
         thickness,
     )
+    return min_x, min_y, max_x, max_y
@@ -1,3 +1,4 @@
+#include <algorithm>
 #include <cstdint>
 #include <cstring>
 #include <limits.h>
@@ -36,6 +37,14 @@ inline void setPixel(size_t _pixels, int width, int height, int x, int y, size_t
     }
 }
 
+inline void setPixels(size_t _pixels, int width, int height, void* vx, void* vy, int len, size_t color, bool blending = false) {
+    int* v_x = (int*) vx;
+    int* v_y = (int*) vy;
+    for (int i = 0; i < len; i++) {
+        setPixel(_pixels, width, height, v_x[i], v_y[i], color, blending);
+    }
+}
+
 inline int getPixel(size_t _pixels, int width, int height, int x, int y) {
     if (x < width && y < height && x >= 0 && y >= 0) {
         return (int) ((uint32_t*) _pixels)[y * width + x];
@@ -90,10 +99,12 @@ inline void colorkeyCopy(size_t source, size_t destination, int width, int heigh
 
 inline void switchColors(size_t _pixels, int width, int height, size_t color1, size_t color2) {
     uint32_t* pixels = (uint32_t*) _pixels;
-    for (int i = 0; i < width * height; i++) {
-        if (pixels[i] == color1) {
-            pixels[i] = color2;
-        }
+    uint32_t c1 = (uint32_t) color1, c2 = (uint32_t) color2;
+    int len = width * height;
+    // branchless select so the compiler can vectorize the loop
+    for (int i = 0; i < len; i++) {
+        uint32_t p = pixels[i];
+        pixels[i] = p == c1 ? c2 : p;
     }
 }
 
@@ -574,9 +585,21 @@ inline void _drawRectThick(size_t _pixels, int width, int height, int x, int y,
 }
 
 inline void _fillRect(size_t _pixels, int width, int height, int x, int y, int w, int h, size_t color, bool blending) {
-    for (int i = y; i < h + y; i++) {
-        for (int j = x; j < w + x; j++) {
-            setPixel(_pixels, width, height, j, i, color, blending);
+    int x1 = x < 0 ? 0 : x, x2 = x + w > width ? width : x + w;
+    int y1 = y < 0 ? 0 : y, y2 = y + h > height ? height : y + h;
+    if (x1 >= x2 || y1 >= y2) return;
+
+    if (blending) {
+        for (int i = y1; i < y2; i++) {
+            for (int j = x1; j < x2; j++) {
+                setPixel(_pixels, width, height, j, i, color, true);
+            }
+        }
+    } else if (x1 == 0 && x2 == width) {
+        std::fill_n((uint32_t*) _pixels + y1 * width, (y2 - y1) * width, (uint32_t) color);
+    } else {
+        for (int i = y1; i < y2; i++) {
+            std::fill_n((uint32_t*) _pixels + i * width + x1, x2 - x1, (uint32_t) color);
         }
     }
 }
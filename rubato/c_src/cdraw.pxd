@@ -8,6 +8,7 @@ cdef extern from "cdraw.cpp":
     size_t clonePixelBuffer(size_t _source, int width, int height)
 
     void setPixel(size_t _pixels, int width, int height, int x, int y, size_t color, bool blending)
+    void setPixels(size_t _pixels, int width, int height, void* vx, void* vy, int len, size_t color, bool blending)
     int getPixel(size_t _pixels, int width, int height, int x, int y)
     void clearPixels(size_t _pixels, int width, int height)
     void blit(size_t _source, size_t _destination, int sw, int sh, int dw, int dh, int srx, int sry, int srw, int srh, int drx, int dry, int drw, int drh)
@@ -53,6 +53,8 @@ class Component:
 
     def true_pos(self) -> Vector:
         """Returns the world position of the component."""
+        if self.offset.x == 0 and self.offset.y == 0:
+            return self.gameobj.true_pos().clone()
         return self.gameobj.true_pos() + self.offset.rotate(self.gameobj.true_rotation())
 
     def true_rotation(self) -> float:
@@ -10,7 +10,8 @@ class Particle:
     A simple particle.
 
     Args:
-        surface: The surface of the particle.
+        surface: The surface of the particle. It is never transformed by the particle system, so one surface can be
+            shared by many particles.
         movement: The movement function of a particle. Takes in a Particle and a delta time.
             Defaults to `Particle.default_movement`.
         pos: The position of the particle. Defaults to (0, 0).
@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import IntEnum, unique
 from random import randint
 from typing import Callable
-import cython
+import cython, math
 
 from . import Particle
 from .. import Component
@@ -135,12 +135,27 @@ class ParticleSystem(Component):
                 particle._system_pos = self.true_pos().clone()
                 particle._system_rotation = self.true_rotation()
 
-            particle.surface.rotation = particle.rotation + particle._system_rotation
-            particle.surface.scale = particle._original_scale * particle.scale
-            Draw.queue_surface(
-                particle.surface,
-                particle._system_pos + particle.pos.rotate(particle._system_rotation),
-                particle.z_index + particle._system_z,
+            z_index = particle.z_index + particle._system_z
+            if camera.z_index < z_index:
+                continue
+
+            pos = particle._system_pos + particle.pos.rotate(particle._system_rotation)
+            scale = particle._original_scale * particle.scale
+            surface = particle.surface
+
+            # same cull as Draw.queue_surface, the half diagonal covers the particle at any rotation
+            reach = math.hypot(surface._width * scale.x, surface._height * scale.y) / 2
+            if Draw._off_camera(camera, pos, reach, reach):
+                continue
+
+            # the transform is bound per draw so particles can share a single surface
+            Draw._push(
+                z_index,
+                Draw._surface,
+                surface,
+                pos,
+                scale,
+                particle.rotation + particle._system_rotation,
                 camera,
             )
 
@@ -151,8 +166,7 @@ class ParticleSystem(Component):
         max_in_dur = round(360 / self.spread) * self.density
         for _ in range(self.density):
             if self.mode == ParticleSystemMode.BURST and self.__time == 0:
-                while self.__generated < max_in_dur and len(self.__particles) < self.max_particles:
-                    self.gen_particle(self.__generated * self.spread)
+                self.__gen_burst(max_in_dur)
             if len(self.__particles) < self.max_particles:
                 if self.mode == ParticleSystemMode.RANDOM:
                     self.gen_particle(randint(0, max_in_dur) * self.spread)
@@ -166,16 +180,41 @@ class ParticleSystem(Component):
                             self.gen_particle((max_in_dur - self.__generated) * self.spread)
 
     def gen_particle(self, angle: float):
+        self.__add_particle(angle, self.__system_transform())
+
+    def __system_transform(self) -> tuple[float, Vector, int] | None:
+        """The rotation, position and z index new particles are given, or None when the system is in local space."""
+        if self.local_space:
+            return None
+        return self.true_rotation(), self.true_pos(), self.true_z()
+
+    def __add_particle(self, angle: float, transform: tuple[float, Vector, int] | None):
+        """Creates a particle at the given angle and places it with an already computed system transform."""
         part = self.new_particle(angle)
         if part is None:
             raise ValueError("new_particle must return a Particle.")
-        if not self.local_space:
-            part._system_rotation = self.true_rotation()
-            part._system_pos = self.true_pos().clone()
-            part._system_z = self.true_z()
+        if transform is not None:
+            part._system_rotation = transform[0]
+            part._system_pos = transform[1].clone()
+            part._system_z = transform[2]
         self.__particles.append(part)
         self.__generated += 1
 
+    def __gen_burst(self, max_in_dur: int):
+        """Generates a whole burst at once, computing the system transform a single time."""
+        # an overridden gen_particle may add any number of particles, so the limits are checked before every call
+        if type(self).gen_particle is not ParticleSystem.gen_particle:
+            while self.__generated < max_in_dur and len(self.__particles) < self.max_particles:
+                self.gen_particle(self.__generated * self.spread)
+            return
+
+        count = min(max_in_dur - self.__generated, self.max_particles - len(self.__particles))
+        if count <= 0:
+            return
+        transform = self.__system_transform()
+        for _ in range(count):
+            self.__add_particle(self.__generated * self.spread, transform)
+
     def clear(self):
         """Clear the system."""
         self.__particles.clear()
@@ -267,7 +267,6 @@ class _Engine:
             return
 
         if pen_b < pen_a:
-            man = Manifold(shape_a, shape_b, abs(pen_a))
             rot = shape_a.gameobj.true_rotation()
             pos = shape_a.gameobj.true_pos()
 
@@ -275,9 +274,8 @@ class _Engine:
             v2 = a_verts[(face_a + 1) % len(a_verts)].rotate(rot) + pos
 
             side_plane_normal = (v2 - v1).normalized()
-            man.normal = side_plane_normal.perpendicular() * Math.sign(pen_a)
+            return Manifold(shape_a, shape_b, abs(pen_a), side_plane_normal.perpendicular() * Math.sign(pen_a))
         else:
-            man = Manifold(shape_a, shape_b, abs(pen_b))
             rot = shape_b.gameobj.true_rotation()
             pos = shape_b.gameobj.true_pos()
 
@@ -285,25 +283,58 @@ class _Engine:
             v2 = b_verts[(face_b + 1) % len(b_verts)].rotate(rot) + pos
 
             side_plane_normal = (v2 - v1).normalized()
-            man.normal = side_plane_normal.perpendicular() * -Math.sign(pen_b)
-
-        return man
+            return Manifold(shape_a, shape_b, abs(pen_b), side_plane_normal.perpendicular() * -Math.sign(pen_b))
 
     @staticmethod
     def _axis_least_penetration(
         a: Polygon | Rectangle, b: Polygon | Rectangle, a_verts: list[Vector], b_verts: list[Vector]
     ) -> tuple[float, int] | tuple[None, None]:
         """Finds the axis of least penetration between two possibly colliding polygons."""
-        best_dist = -Math.INF
-        best_ind = 0
-        a_rot = a.gameobj.true_rotation()
-        b_rot = b.gameobj.true_rotation()
-
-        for i in range(len(a_verts)):
-            n = _Engine._get_normal(a_verts, i).rotate(a_rot).rotate(-b_rot)
-            s = _Engine._get_support(b_verts, -n)
-            v = (a_verts[i].rotate(a_rot) + a.gameobj.true_pos() - b.gameobj.true_pos()).rotate(-b_rot)
-            d = n.dot(s - v)
+        # everything is done in b's local space on plain floats, a's rotation relative to b is computed once
+        best_dist: float = -Math.INF
+        best_ind: int = 0
+        a_rot: float = a.gameobj.true_rotation()
+        b_rot: float = b.gameobj.true_rotation()
+
+        rel: float = math.radians(b_rot - a_rot)
+        c: float = math.cos(rel)
+        s: float = math.sin(rel)
+        b_rad: float = math.radians(b_rot)
+        bc: float = math.cos(b_rad)
+        bs: float = math.sin(b_rad)
+        offset: Vector = a.gameobj.true_pos() - b.gameobj.true_pos()
+        ox: float = offset.x * bc - offset.y * bs
+        oy: float = offset.x * bs + offset.y * bc
+
+        n: int = len(a_verts)
+        for i in range(n):
+            v1: Vector = a_verts[i]
+            v2: Vector = a_verts[(i + 1) % n]
+
+            # face normal, rotated into b's space
+            fx: float = v2.y - v1.y
+            fy: float = v1.x - v2.x
+            mag: float = math.sqrt(fx * fx + fy * fy)
+            if mag != 0:
+                fx /= mag
+                fy /= mag
+            nx: float = fx * c - fy * s
+            ny: float = fx * s + fy * c
+
+            # support point of b in the direction opposite the normal
+            best_proj: float = -Math.INF
+            sx: float = 0
+            sy: float = 0
+            for bv in b_verts:
+                projection: float = -bv.x * nx - bv.y * ny
+                if projection > best_proj:
+                    best_proj = projection
+                    sx = bv.x
+                    sy = bv.y
+
+            vx: float = v1.x * c - v1.y * s + ox
+            vy: float = v1.x * s + v1.y * c + oy
+            d: float = nx * (sx - vx) + ny * (sy - vy)
 
             if d > best_dist:
                 best_dist = d
@@ -313,21 +344,6 @@ class _Engine:
 
         return best_dist, best_ind
 
-    @staticmethod
-    def _get_support(verts: list[Vector], direction: Vector) -> Vector | None:
-        """Gets the furthest support vertex in a given direction."""
-        best_proj = -Math.INF
-        best_vert = None
-
-        for v in verts:
-            projection = v.dot(direction)
-
-            if projection > best_proj:
-                best_vert = v
-                best_proj = projection
-
-        return best_vert
-
     @staticmethod
     def _get_normal(verts: list[Vector], index: int) -> Vector:
         """Finds a vector perpendicular to a side"""
@@ -352,7 +368,7 @@ class Manifold:
         shape_a: Hitbox,
         shape_b: Hitbox,
         penetration: float = 0,
-        normal: Vector = Vector(),
+        normal: Vector | tuple[float, float] = (0, 0),
     ):
         self.shape_a: Hitbox = shape_a
         """The reference shape."""
@@ -360,7 +376,7 @@ class Manifold:
         """The incident (colliding) shape."""
         self.penetration: float = penetration
         """The amount by which the colliders are intersecting."""
-        self.normal: Vector = normal
+        self.normal: Vector = Vector.create(normal)
         """The direction that would most quickly separate the two colliders."""
 
     def __repr__(self) -> str:
@@ -135,15 +135,23 @@ class Hitbox(Component):
             self._old_scale = self.scale
 
     def draw(self, camera: Camera):
+        show_debug = self.debug or Game.debug
+        if not (self.color or show_debug):
+            return
+
+        # both images share one transform, so only walk the gameobject chain once
+        rot = self.true_rotation()
+        pos = self.true_pos()
+
         if self.color:
-            self._image.rotation = self.true_rotation()
+            self._image.rotation = rot
 
-            Draw.queue_surface(self._image, self.true_pos(), self.true_z(), camera)
+            Draw.queue_surface(self._image, pos, self.true_z(), camera)
 
-        if self.debug or Game.debug:
-            self._debug_image.rotation = self.true_rotation()
+        if show_debug:
+            self._debug_image.rotation = rot
 
-            Draw.queue_surface(self._debug_image, self.true_pos(), Math.INF, camera=camera)
+            Draw.queue_surface(self._debug_image, pos, Math.INF, camera=camera)
 
 
 class Polygon(Hitbox):
@@ -241,11 +249,11 @@ class Polygon(Hitbox):
         for vert in verts:
             if vert.y > top:
                 top = vert.y
-            elif vert.y < bottom:
+            if vert.y < bottom:
                 bottom = vert.y
             if vert.x > right:
                 right = vert.x
-            elif vert.x < left:
+            if vert.x < left:
                 left = vert.x
 
         return Vector(left, bottom), Vector(right, top)
@@ -258,19 +266,21 @@ class Polygon(Hitbox):
         """
         Returns a list of the Polygon's vertices in world coordinates. Accounts for gameobject position and rotation.
         """
-        return [v.rotate(self.gameobj.true_rotation()) + self.gameobj.true_pos() for v in self.offset_verts()]
+        rot = self.gameobj.true_rotation()
+        pos = self.gameobj.true_pos()
+        return [v.rotate(rot) + pos for v in self.offset_verts()]
 
     def regen(self):
         self._offset_verts = [(vert * self.scale).rotate(self.rot_offset) + self.offset for vert in self.verts]
 
     def redraw(self):
-        super().redraw()
-
         w = round(self.radius * self.scale.x * 2)
         h = round(self.radius * self.scale.y * 2)
         if w != self._image.width or h != self._image.height:
             self._image = Surface(w, h)
             self._debug_image = Surface(w, h)
+        else:
+            super().redraw()
 
         if self.color is not None:
             self._image.draw_poly(self.verts, (0, 0), fill=self.color, aa=True, blending=False)
@@ -508,11 +518,11 @@ class Rectangle(Hitbox):
         for vert in verts:
             if vert.y > top:
                 top = vert.y
-            elif vert.y < bottom:
+            if vert.y < bottom:
                 bottom = vert.y
             if vert.x > right:
                 right = vert.x
-            elif vert.x < left:
+            if vert.x < left:
                 left = vert.x
 
         return Vector(left, bottom), Vector(right, top)
@@ -525,7 +535,9 @@ class Rectangle(Hitbox):
         """
         Returns a list of the Rectangle's vertices in world coordinates. Accounts for gameobject position and rotation.
         """
-        return [v.rotate(self.gameobj.true_rotation()) + self.gameobj.true_pos() for v in self.offset_verts()]
+        rot = self.gameobj.true_rotation()
+        pos = self.gameobj.true_pos()
+        return [v.rotate(rot) + pos for v in self.offset_verts()]
 
     def regen(self):
         w = self.width / 2
@@ -534,16 +546,17 @@ class Rectangle(Hitbox):
         self._offset_verts = [(vert * self.scale).rotate(self.rot_offset) + self.offset for vert in self._verts]
 
     def redraw(self):
-        self._debug_image.clear()
-
         w = round(self.width * self.scale.x)
         h = round(self.height * self.scale.y)
         if w != self._image.width or h != self._image.height:
             self._image = Surface(w, h)
             self._debug_image = Surface(w, h)
+        else:
+            self._debug_image.clear()
 
         if self.color is not None:
-            self._image.fill(self.color)
+            # the fill covers the whole image, so overwrite it instead of blending over the last color
+            self._image.draw_rect((0, 0), (w, h), fill=self.color, blending=False)
         self._debug_image.draw_rect((0, 0), (w, h), Color.debug, 2, blending=False)
 
     def contains_pt(self, pt: Vector | tuple[float, float]) -> bool:
@@ -651,14 +664,14 @@ class Circle(Hitbox):
         return self.radius * self.scale.max()
 
     def redraw(self):
-        super().redraw()
-
         int_r = round(self.radius * self.scale.max())
         size = int_r * 2 + 1
 
         if size != self._image.width:
             self._image = Surface(size, size)
             self._debug_image = Surface(size, size)
+        else:
+            super().redraw()
 
         if self.color is not None:
             self._image.draw_circle((0, 0), int_r, fill=self.color, aa=True, blending=False)
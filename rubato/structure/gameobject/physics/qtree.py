@@ -4,7 +4,19 @@ QuadTree implementation to optimize collision detection as part of the physics e
 import Cython
 
 from . import Hitbox, _Engine
-from .... import Vector
+from .... import Vector, Math
+
+# bounding boxes are kept as plain (left, bottom, right, top) floats since the tree only lives for one step
+_BB = tuple[float, float, float, float]
+
+
+def _collide_pair(hb_a: Hitbox, bb_a: _BB, hb_b: Hitbox, bb_b: _BB):
+    """Runs the narrow phase on a pair, unless their bounding boxes are apart and they weren't already colliding."""
+    if (bb_a[2] < bb_b[0]) or (bb_b[2] < bb_a[0]) or (bb_a[3] < bb_b[1]) or (bb_b[3] < bb_a[1]):
+        # the pair still has to go through collide once so that it can call on_exit
+        if hb_b not in hb_a.colliding and hb_a not in hb_b.colliding:
+            return
+    _Engine.collide(hb_a, hb_b)
 
 
 # _QTree acts like a function, but keep it as a class for future optimization as well as Cython.cclass optimization.
@@ -13,55 +25,64 @@ class _QTree:
     """The Quadtree itself."""
 
     def __init__(self, hbs: list[list[Hitbox]]):
-        self.bbs: list[tuple[Vector, Vector]] = []
-
-        tl: Vector = Vector.infinity()
-        br: Vector = -1 * Vector.infinity()
+        # each group is stored alongside the bounding box of every one of its hitboxes
+        self.groups: list[list[tuple[Hitbox, _BB]]] = []
+        self.bbs: list[_BB] = []
+
+        left: float = Math.INF
+        bottom: float = Math.INF
+        right: float = -Math.INF
+        top: float = -Math.INF
         for gen in hbs:
-            local_tl: Vector = Vector.infinity()
-            local_br: Vector = -1 * Vector.infinity()
+            group: list[tuple[Hitbox, _BB]] = []
+            local_left: float = Math.INF
+            local_bottom: float = Math.INF
+            local_right: float = -Math.INF
+            local_top: float = -Math.INF
             for hb in gen:
                 aabb: tuple[Vector, Vector] = hb.get_aabb()
-
-                if aabb[0].x < local_tl.x:
-                    if aabb[0].x < tl.x:
-                        tl.x = local_tl.x = aabb[0].x
-                    else:
-                        local_tl.x = aabb[0].x
-                if aabb[0].y < local_tl.y:
-                    if aabb[0].y < tl.y:
-                        tl.y = local_tl.y = aabb[0].y
-                    else:
-                        local_tl.y = aabb[0].y
-                if aabb[1].x > local_br.x:
-                    if aabb[1].x > br.x:
-                        br.x = local_br.x = aabb[1].x
-                    else:
-                        local_br.x = aabb[1].x
-                if aabb[1].y > local_br.y:
-                    if aabb[1].y > br.y:
-                        br.y = local_br.y = aabb[1].y
-                    else:
-                        local_br.y = aabb[1].y
-            self.bbs.append((local_tl, local_br))
-
-        self.stack: list[list[Hitbox]] = []
-
-        center: Vector = (tl + br) / 2
-
-        self.northeast: _STree = _STree(Vector(center.x, tl.y), Vector(br.x, center.y))
-        self.northwest: _STree = _STree(tl, center)
-        self.southeast: _STree = _STree(center, br)
-        self.southwest: _STree = _STree(Vector(tl.x, center.y), Vector(center.x, br.y))
-
-        for i in range(len(hbs)):
-            bb: tuple[Vector, Vector] = self.bbs[i]
-            hbg: list[Hitbox] = hbs[i]
-
-            for hb in hbg:
+                bl: Vector = aabb[0]
+                tr: Vector = aabb[1]
+                group.append((hb, (bl.x, bl.y, tr.x, tr.y)))
+
+                if bl.x < local_left:
+                    local_left = bl.x
+                if bl.y < local_bottom:
+                    local_bottom = bl.y
+                if tr.x > local_right:
+                    local_right = tr.x
+                if tr.y > local_top:
+                    local_top = tr.y
+            self.groups.append(group)
+            self.bbs.append((local_left, local_bottom, local_right, local_top))
+
+            if local_left < left:
+                left = local_left
+            if local_bottom < bottom:
+                bottom = local_bottom
+            if local_right > right:
+                right = local_right
+            if local_top > top:
+                top = local_top
+
+        self.stack: list[list[tuple[Hitbox, _BB]]] = []
+
+        cx: float = (left + right) / 2
+        cy: float = (bottom + top) / 2
+
+        self.northeast: _STree = _STree(cx, bottom, right, cy)
+        self.northwest: _STree = _STree(left, bottom, cx, cy)
+        self.southeast: _STree = _STree(cx, cy, right, top)
+        self.southwest: _STree = _STree(left, cy, cx, top)
+
+        for i in range(len(self.groups)):
+            bb: _BB = self.bbs[i]
+            hbg: list[tuple[Hitbox, _BB]] = self.groups[i]
+
+            for hb, hb_bb in hbg:
                 for li in self.stack:
-                    for item in li:
-                        _Engine.collide(hb, item)
+                    for item, item_bb in li:
+                        _collide_pair(hb, hb_bb, item, item_bb)
 
             self.northeast.collide(hbg, bb)
             self.northwest.collide(hbg, bb)
@@ -77,11 +98,13 @@ class _QTree:
 class _STree:
     """A Subtree."""
 
-    def __init__(self, top_left: Vector, bottom_right: Vector):
-        self.top_left: Vector = top_left
-        self.bottom_right: Vector = bottom_right
+    def __init__(self, left: float, bottom: float, right: float, top: float):
+        self.left: float = left
+        self.bottom: float = bottom
+        self.right: float = right
+        self.top: float = top
 
-        self.stack: list[list[Hitbox]] = []
+        self.stack: list[list[tuple[Hitbox, _BB]]] = []
 
         self.has_children: bool = False
 
@@ -90,9 +113,8 @@ class _STree:
         self.southeast: _STree
         self.southwest: _STree
 
-    def insert(self, hbs: list[Hitbox], bb: tuple[Vector, Vector]) -> bool:
-        if (bb[0].x < self.top_left.x) or (bb[0].y < self.top_left.y) \
-            or (bb[1].x > self.bottom_right.x) or (bb[1].y > self.bottom_right.y):
+    def insert(self, hbs: list[tuple[Hitbox, _BB]], bb: _BB) -> bool:
+        if (bb[0] < self.left) or (bb[1] < self.bottom) or (bb[2] > self.right) or (bb[3] > self.top):
             return False
 
         if not self.stack:
@@ -101,11 +123,12 @@ class _STree:
 
         if not self.has_children:
             self.has_children = True
-            center: Vector = (self.top_left + self.bottom_right) / 2
-            self.northeast = _STree(Vector(center.x, self.top_left.y), Vector(self.bottom_right.x, center.y))
-            self.northwest = _STree(self.top_left, center)
-            self.southeast = _STree(center, self.bottom_right)
-            self.southwest = _STree(Vector(self.top_left.x, center.y), Vector(center.x, self.bottom_right.y))
+            cx: float = (self.left + self.right) / 2
+            cy: float = (self.bottom + self.top) / 2
+            self.northeast = _STree(cx, self.bottom, self.right, cy)
+            self.northwest = _STree(self.left, self.bottom, cx, cy)
+            self.southeast = _STree(cx, cy, self.right, self.top)
+            self.southwest = _STree(self.left, cy, cx, self.top)
 
         if not self.northeast.insert(hbs, bb) and not self.northwest.insert(hbs, bb) \
             and not self.southeast.insert(hbs, bb) and not self.southwest.insert(hbs, bb):
@@ -113,15 +136,14 @@ class _STree:
 
         return True
 
-    def collide(self, hbs: list[Hitbox], bb: tuple[Vector, Vector]):
-        if (bb[1].y < self.top_left.y) or (bb[1].x < self.top_left.x) \
-            or (bb[0].y > self.bottom_right.y) or (bb[0].x > self.bottom_right.x):
+    def collide(self, hbs: list[tuple[Hitbox, _BB]], bb: _BB):
+        if (bb[3] < self.bottom) or (bb[2] < self.left) or (bb[1] > self.top) or (bb[0] > self.right):
             return
 
-        for hb in hbs:
+        for hb, hb_bb in hbs:
             for current in self.stack:
-                for item in current:
-                    _Engine.collide(hb, item)
+                for item, item_bb in current:
+                    _collide_pair(hb, hb_bb, item, item_bb)
 
         if self.has_children:
             self.northeast.collide(hbs, bb)
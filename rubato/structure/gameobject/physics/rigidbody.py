@@ -90,11 +90,17 @@ class RigidBody(Component):
 
     def _tick(self):
         """Applies general kinematic laws to the rigidbody."""
-        self.velocity += self.gravity * Time.fixed_delta
-        self.velocity.clamp(-self.max_speed, self.max_speed)  # pylint: disable=invalid-unary-operand-type
-
-        self.gameobj.pos += self.velocity * Time.fixed_delta
-        self.gameobj.rotation += self.ang_vel * Time.fixed_delta
+        # typed locals compile to plain C doubles, so the arithmetic below never boxes a float
+        dt: float = Time.fixed_delta
+        max_x: float = self.max_speed.x
+        max_y: float = self.max_speed.y
+        vx: float = min(max(self.velocity.x + self.gravity.x * dt, -max_x), max_x)
+        vy: float = min(max(self.velocity.y + self.gravity.y * dt, -max_y), max_y)
+        self.velocity = Vector(vx, vy)
+
+        pos = self.gameobj.pos
+        self.gameobj.pos = Vector(pos.x + vx * dt, pos.y + vy * dt)
+        self.gameobj.rotation += self.ang_vel * dt
 
     def add_force(self, force: Vector | tuple[float, float]):
         """
@@ -103,8 +109,9 @@ class RigidBody(Component):
         Args:
             force: The force to add.
         """
-        self.velocity.x += force[0] * self.inv_mass * Time.fixed_delta
-        self.velocity.y += force[1] * self.inv_mass * Time.fixed_delta
+        scale = self.inv_mass * Time.fixed_delta
+        self.velocity.x += force[0] * scale
+        self.velocity.y += force[1] * scale
 
     def add_impulse(self, impulse: Vector | tuple[float, float]):
         """
@@ -113,8 +120,9 @@ class RigidBody(Component):
         Args:
             impulse: The impulse to add.
         """
-        self.velocity.x += impulse[0] * Time.fixed_delta
-        self.velocity.y += impulse[1] * Time.fixed_delta
+        dt = Time.fixed_delta
+        self.velocity.x += impulse[0] * dt
+        self.velocity.y += impulse[1] * dt
 
     def add_cont_force(self, force: Vector | tuple[float, float], time: float):
         """
@@ -141,6 +141,22 @@ class Raster(Component):
         """
         self.surf.set_pixel(pos, color, blending)
 
+    def set_pixels(
+        self,
+        points: list[Vector] | list[tuple[float, float]],
+        color: Color = Color.black,
+        blending: bool = True,
+    ):
+        """
+        Draws many points of the same color on the surface in a single call.
+
+        Args:
+            points: The positions of the points.
+            color: The color of the points. Defaults to black.
+            blending: Whether to use blending. Defaults to True.
+        """
+        self.surf.set_pixels(points, color, blending)
+
     def draw_line(
         self,
         start: Vector | tuple[float, float],
@@ -62,6 +62,7 @@ class Text(Component):
             self.font_object = Font()
 
         self._uptodate = False
+        self._rendered: tuple | None = None
 
         self._font = self.font_object._font
         self._size = self.font_object._size
@@ -131,11 +132,24 @@ class Text(Component):
                 self._color != self.font_object._color or self._styles != self.font_object._styles:
             self._font = self.font_object._font
             self._size = self.font_object._size
-            self._color = self.font_object._color
+            self._color = self.font_object._color.clone()
             self._styles = self.font_object._styles
             self._uptodate = False
         if not self._uptodate:
-            self._regen()
+            # skip the rasterization if the inputs were changed back to what is already rendered
+            inputs = (
+                self._text,
+                self._justify,
+                self._width,
+                self._af,
+                self._font,
+                self._size,
+                self._color.to_tuple(),
+                self._styles,
+            )
+            if inputs != self._rendered:
+                self._regen()
+                self._rendered = inputs
             self._uptodate = True
 
     def draw(self, camera: Camera):
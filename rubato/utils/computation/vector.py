@@ -201,17 +201,22 @@ class Vector:
         if out is None:
             out = Vector()
 
-        if not isinstance(lower, Vector):
-            lower = Vector(lower, lower)
-        if not isinstance(upper, Vector):
-            upper = Vector(upper, upper)
+        if isinstance(lower, Vector):
+            lower_x, lower_y = lower.x, lower.y
+        else:
+            lower_x = lower_y = lower
+        if isinstance(upper, Vector):
+            upper_x, upper_y = upper.x, upper.y
+        else:
+            upper_x = upper_y = upper
 
-        out.x = Math.clamp(self.x, lower.x, upper.x)
-        out.y = Math.clamp(self.y, lower.y, upper.y)
+        x: float = min(max(self.x, lower_x), upper_x)
+        y: float = min(max(self.y, lower_y), upper_y)
 
         if absolute:
-            out.x = abs(out.x)
-            out.y = abs(out.y)
+            x, y = abs(x), abs(y)
+
+        out.x, out.y = x, y
 
         return out
 
@@ -415,13 +420,34 @@ class Vector:
         Returns:
             A new vector with the magnitude clamped to the given range.
         """
-        vector_c = vector.clone()
-        magnitude = vector_c.magnitude
-        new = Math.clamp((magnitude), min_magnitude, max_magnitude)
-        if new != magnitude:
-            vector_c.magnitude = new
+        x, y = vector.x, vector.y
+        mag_sq = x * x + y * y
+        if mag_sq > max_magnitude * max_magnitude or (mag_sq != 0 and mag_sq < min_magnitude * min_magnitude):
+            magnitude = math.sqrt(mag_sq)
+            ratio = Math.clamp(magnitude, min_magnitude, max_magnitude) / magnitude
+            x *= ratio
+            y *= ratio
+
+        return Vector(x, y)
+
+    @staticmethod
+    def clamp_magnitude_xy(x: float | int, y: float | int, max_magnitude: float | int) -> tuple[float, float]:
+        """
+        Clamps the magnitude of the vector (x, y) to the given maximum without creating a Vector.
+
+        Args:
+            x: The x coordinate of the vector.
+            y: The y coordinate of the vector.
+            max_magnitude: The maximum magnitude of the vector.
 
-        return vector_c
+        Returns:
+            The x and y coordinates of the clamped vector.
+        """
+        mag_sq = x * x + y * y
+        if mag_sq > max_magnitude * max_magnitude:
+            ratio = max_magnitude / math.sqrt(mag_sq)
+            return x * ratio, y * ratio
+        return x, y
 
     @classmethod
     def angle_between(cls, a: Vector, b: Vector) -> float:
@@ -25,6 +25,17 @@ class Input:
 
     _controllers: dict[int, sdl2.SDL_Joystick] = {}
     _joystick_max: int = 32768
+    _hat_names: dict[int, str] = {
+        sdl2.SDL_HAT_CENTERED: "center",
+        sdl2.SDL_HAT_UP: "up",
+        sdl2.SDL_HAT_RIGHT: "right",
+        sdl2.SDL_HAT_DOWN: "down",
+        sdl2.SDL_HAT_LEFT: "left",
+        sdl2.SDL_HAT_RIGHTUP: "right up",
+        sdl2.SDL_HAT_RIGHTDOWN: "right down",
+        sdl2.SDL_HAT_LEFTUP: "left up",
+        sdl2.SDL_HAT_LEFTDOWN: "left down",
+    }
 
     @classmethod
     def controllers(cls) -> list[int]:
@@ -138,25 +149,7 @@ class Input:
         Returns:
             str: The string representation of the hat value.
         """
-        if val == sdl2.SDL_HAT_CENTERED:
-            return "center"
-        elif val == sdl2.SDL_HAT_UP:
-            return "up"
-        elif val == sdl2.SDL_HAT_RIGHT:
-            return "right"
-        elif val == sdl2.SDL_HAT_DOWN:
-            return "down"
-        elif val == sdl2.SDL_HAT_LEFT:
-            return "left"
-        elif val == sdl2.SDL_HAT_RIGHTUP:
-            return "right up"
-        elif val == sdl2.SDL_HAT_RIGHTDOWN:
-            return "right down"
-        elif val == sdl2.SDL_HAT_LEFTUP:
-            return "left up"
-        elif val == sdl2.SDL_HAT_LEFTDOWN:
-            return "left down"
-        return "unknown"
+        return cls._hat_names.get(val, "unknown")
 
     # KEYBOARD METHODS
 
@@ -302,7 +295,8 @@ class Input:
             A tuple with 5 booleans representing the state of each
             mouse button. (button1, button2, button3, button4, button5)
         """
-        info = sdl2.SDL_GetMouseState(ctypes.byref(c_int(0)), ctypes.byref(c_int(0)))
+        # only the button mask is needed, so don't have SDL write the position anywhere
+        info = sdl2.SDL_GetMouseState(None, None)
         return (
             (info & sdl2.SDL_BUTTON_LMASK) != 0,
             (info & sdl2.SDL_BUTTON_MMASK) != 0,
@@ -9,8 +9,8 @@ broadcast that event key using :meth:`Radio.broadcast`.
 :ref:`Go here <api:events>` to see all the events that can be broadcast.
 """
 from __future__ import annotations
-import ctypes
 from typing import Any, Callable
+import inspect
 from contextlib import suppress
 import sdl2
 import cython
@@ -20,6 +20,10 @@ from .events import Events, KeyResponse, MouseButtonResponse, MouseMotionRespons
     JoyAxisMotionResponse, JoyButtonResponse, JoyHatMotionResponse, ResizeResponse, JoystickConnectResponse, \
         JoystickDisconnectResponse
 
+# events are taken off the SDL queue in batches to cut down on ctypes calls
+_EVENT_BATCH_SIZE: int = 64
+_event_batch = (sdl2.SDL_Event * _EVENT_BATCH_SIZE)()
+
 
 # THIS IS A STATIC CLASS
 class Radio:
@@ -42,148 +46,165 @@ class Radio:
         Returns:
             bool: Whether an SDL Quit event was fired.
         """
-        event = sdl2.SDL_Event()
-
-        while sdl2.SDL_PeepEvents(
-            ctypes.byref(event), 1, sdl2.SDL_GETEVENT, sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT
-        ) > 0:
-            if event.type == sdl2.SDL_QUIT:
-                return True
-            elif event.type == sdl2.SDL_WINDOWEVENT:
-                if event.window.event == sdl2.SDL_WINDOWEVENT_RESIZED:
-                    if Events.RESIZE.value in cls.listeners:
+        while True:
+            count: cython.int = sdl2.SDL_PeepEvents(
+                _event_batch, _EVENT_BATCH_SIZE, sdl2.SDL_GETEVENT, sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT
+            )
+            i: cython.int
+            for i in range(count):
+                event = _event_batch[i]
+                # ctypes field reads are slow, so read the type once and each union member only in its branch
+                ev_type: cython.int = event.type
+                if ev_type == sdl2.SDL_QUIT:
+                    return True
+                elif ev_type == sdl2.SDL_WINDOWEVENT:
+                    window = event.window
+                    if window.event == sdl2.SDL_WINDOWEVENT_RESIZED:
+                        if Events.RESIZE.value in cls.listeners:
+                            cls.broadcast(
+                                Events.RESIZE,
+                                ResizeResponse(
+                                    window.timestamp / 1000,
+                                    window.data1,
+                                    window.data2,
+                                    Display.window_size.x,  # type: ignore
+                                    Display.window_size.y,  # type: ignore
+                                )
+                            )
+                        Display.window_size = (
+                            window.data1,
+                            window.data2,
+                        )
+                elif ev_type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
+                    key = event.key
+                    key_info, unicode = key.keysym, ""
+                    with suppress(ValueError):
+                        unicode = chr(key_info.sym)
+
+                    if ev_type == sdl2.SDL_KEYUP:
+                        event_name = Events.KEYUP
+                    else:
+                        event_name = (Events.KEYDOWN, Events.KEYHOLD)[key.repeat]
+
+                    if event_name.value in cls.listeners:
+                        cls.broadcast(
+                            event_name,
+                            KeyResponse(
+                                key.timestamp / 1000,
+                                Input.get_name(key_info.sym),
+                                unicode,
+                                int(key_info.sym),
+                                key_info.mod,
+                            )
+                        )
+                elif ev_type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
+                    if ev_type == sdl2.SDL_MOUSEBUTTONUP:
+                        event_name = Events.MOUSEUP
+                    else:
+                        event_name = Events.MOUSEDOWN
+
+                    if event_name.value in cls.listeners:
+                        button = event.button
                         cls.broadcast(
-                            Events.RESIZE,
-                            ResizeResponse(
-                                event.window.timestamp / 1000,
-                                event.window.data1,
-                                event.window.data2,
-                                Display.window_size.x,  # type: ignore
-                                Display.window_size.y,  # type: ignore
+                            event_name,
+                            MouseButtonResponse(
+                                button.timestamp / 1000,
+                                button.button,
+                                button.x - Display._half_res[0],
+                                Display._half_res[1] - button.y,
+                                button.clicks,
+                                button.which,
                             )
                         )
-                    Display.window_size = (
-                        event.window.data1,
-                        event.window.data2,
-                    )
-            elif event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
-                key_info, unicode = event.key.keysym, ""
-                with suppress(ValueError):
-                    unicode = chr(key_info.sym)
-
-                if event.type == sdl2.SDL_KEYUP:
-                    event_name = Events.KEYUP
-                else:
-                    event_name = (Events.KEYDOWN, Events.KEYHOLD)[event.key.repeat]
-
-                if event_name.value in cls.listeners:
-                    cls.broadcast(
-                        event_name,
-                        KeyResponse(
-                            event.key.timestamp / 1000,
-                            Input.get_name(key_info.sym),
-                            unicode,
-                            int(key_info.sym),
-                            key_info.mod,
+                elif ev_type == sdl2.SDL_MOUSEWHEEL:
+                    if Events.MOUSEWHEEL.value in cls.listeners:
+                        wheel = event.wheel
+                        cls.broadcast(
+                            Events.MOUSEWHEEL,
+                            MouseWheelResponse(
+                                wheel.timestamp / 1000,
+                                wheel.preciseX,
+                                -wheel.preciseY,
+                                wheel.which,
+                            )
                         )
-                    )
-            elif event.type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
-                if event.type == sdl2.SDL_MOUSEBUTTONUP:
-                    event_name = Events.MOUSEUP
-                else:
-                    event_name = Events.MOUSEDOWN
-
-                if event_name.value in cls.listeners:
-                    cls.broadcast(
-                        event_name,
-                        MouseButtonResponse(
-                            event.button.timestamp / 1000,
-                            event.button.button,
-                            event.button.x - Display._half_res[0],
-                            Display._half_res[1] - event.button.y,
-                            event.button.clicks,
-                            event.button.which,
+                elif ev_type == sdl2.SDL_MOUSEMOTION:
+                    if Events.MOUSEMOTION.value in cls.listeners:
+                        motion = event.motion
+                        cls.broadcast(
+                            Events.MOUSEMOTION,
+                            MouseMotionResponse(
+                                motion.timestamp / 1000,
+                                motion.x - Display._half_res[0],
+                                Display._half_res[1] - motion.y,
+                                motion.xrel,
+                                -motion.yrel,
+                                motion.which,
+                            )
                         )
-                    )
-            elif event.type == sdl2.SDL_MOUSEWHEEL:
-                if Events.MOUSEWHEEL.value in cls.listeners:
-                    cls.broadcast(
-                        Events.MOUSEWHEEL,
-                        MouseWheelResponse(
-                            event.wheel.timestamp / 1000,
-                            event.wheel.preciseX,
-                            -event.wheel.preciseY,
-                            event.wheel.which,
+                elif ev_type == sdl2.SDL_JOYDEVICEADDED:
+                    jdevice = event.jdevice
+                    Input._controllers[jdevice.which] = sdl2.SDL_JoystickOpen(jdevice.which)
+                    if Events.JOYSTICKCONNECT.value in cls.listeners:
+                        cls.broadcast(
+                            Events.JOYSTICKCONNECT,
+                            JoystickConnectResponse(jdevice.timestamp / 1000, jdevice.which),
                         )
-                    )
-            elif event.type == sdl2.SDL_MOUSEMOTION:
-                if Events.MOUSEMOTION.value in cls.listeners:
-                    cls.broadcast(
-                        Events.MOUSEMOTION,
-                        MouseMotionResponse(
-                            event.motion.timestamp / 1000,
-                            event.motion.x - Display._half_res[0],
-                            Display._half_res[1] - event.motion.y,
-                            event.motion.xrel,
-                            -event.motion.yrel,
-                            event.motion.which,
+                elif ev_type == sdl2.SDL_JOYDEVICEREMOVED:
+                    jdevice = event.jdevice
+                    sdl2.SDL_JoystickClose(Input._controllers[jdevice.which])
+                    del Input._controllers[jdevice.which]
+                    if Events.JOYSTICKDISCONNECT.value in cls.listeners:
+                        cls.broadcast(
+                            Events.JOYSTICKDISCONNECT,
+                            JoystickDisconnectResponse(jdevice.timestamp / 1000, jdevice.which),
                         )
-                    )
-            elif event.type == sdl2.SDL_JOYDEVICEADDED:
-                Input._controllers[event.jdevice.which] = sdl2.SDL_JoystickOpen(event.jdevice.which)
-                if Events.JOYSTICKCONNECT.value in cls.listeners:
-                    cls.broadcast(
-                        Events.JOYSTICKCONNECT,
-                        JoystickConnectResponse(event.jdevice.timestamp / 1000, event.jdevice.which),
-                    )
-            elif event.type == sdl2.SDL_JOYDEVICEREMOVED:
-                sdl2.SDL_JoystickClose(Input._controllers[event.jdevice.which])
-                del Input._controllers[event.jdevice.which]
-                if Events.JOYSTICKDISCONNECT.value in cls.listeners:
-                    cls.broadcast(
-                        Events.JOYSTICKDISCONNECT,
-                        JoystickDisconnectResponse(event.jdevice.timestamp / 1000, event.jdevice.which),
-                    )
-            elif event.type == sdl2.SDL_JOYAXISMOTION:
-                mag: float = event.jaxis.value / Input._joystick_max
-                if Events.JOYAXISMOTION.value in cls.listeners:
-                    cls.broadcast(
-                        Events.JOYAXISMOTION,
-                        JoyAxisMotionResponse(
-                            event.jaxis.timestamp / 1000,
-                            event.jaxis.which,
-                            event.jaxis.axis,
-                            mag,
-                            Input.axis_centered(mag),
+                elif ev_type == sdl2.SDL_JOYAXISMOTION:
+                    jaxis = event.jaxis
+                    mag: float = jaxis.value / Input._joystick_max
+                    if Events.JOYAXISMOTION.value in cls.listeners:
+                        cls.broadcast(
+                            Events.JOYAXISMOTION,
+                            JoyAxisMotionResponse(
+                                jaxis.timestamp / 1000,
+                                jaxis.which,
+                                jaxis.axis,
+                                mag,
+                                Input.axis_centered(mag),
+                            )
                         )
-                    )
-            elif event.type in (sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP):
-                if event.type == sdl2.SDL_JOYBUTTONUP:
-                    event_name = Events.JOYBUTTONUP
-                else:
-                    event_name = Events.JOYBUTTONDOWN
-
-                if event_name.value in cls.listeners:
-                    cls.broadcast(
-                        event_name,
-                        JoyButtonResponse(
-                            event.jbutton.timestamp / 1000,
-                            event.jbutton.which,
-                            event.jbutton.button,
+                elif ev_type in (sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP):
+                    if ev_type == sdl2.SDL_JOYBUTTONUP:
+                        event_name = Events.JOYBUTTONUP
+                    else:
+                        event_name = Events.JOYBUTTONDOWN
+
+                    if event_name.value in cls.listeners:
+                        jbutton = event.jbutton
+                        cls.broadcast(
+                            event_name,
+                            JoyButtonResponse(
+                                jbutton.timestamp / 1000,
+                                jbutton.which,
+                                jbutton.button,
+                            )
                         )
-                    )
-            elif event.type == sdl2.SDL_JOYHATMOTION:
-                if Events.JOYHATMOTION.value in cls.listeners:
-                    cls.broadcast(
-                        Events.JOYHATMOTION,
-                        JoyHatMotionResponse(
-                            event.jhat.timestamp / 1000,
-                            event.jhat.which,
-                            event.jhat.hat,
-                            event.jhat.value,
-                            Input.translate_hat(event.jhat.value),
+                elif ev_type == sdl2.SDL_JOYHATMOTION:
+                    if Events.JOYHATMOTION.value in cls.listeners:
+                        jhat = event.jhat
+                        cls.broadcast(
+                            Events.JOYHATMOTION,
+                            JoyHatMotionResponse(
+                                jhat.timestamp / 1000,
+                                jhat.which,
+                                jhat.hat,
+                                jhat.value,
+                                Input.translate_hat(jhat.value),
+                            )
                         )
-                    )
+
+            if count < _EVENT_BATCH_SIZE:
+                break
 
         return False
 
@@ -197,8 +218,13 @@ class Radio:
             params: The event parameters (usually a dictionary). Defaults to None.
         """
         # pylint: disable=isinstance-second-argument-not-valid-type
-        for listener in cls.listeners.get(event.value if isinstance(event, Events) else event, []):
-            listener._ping(params or EventResponse(Time.now()))
+        listeners = cls.listeners.get(event.value if isinstance(event, Events) else event)
+        if not listeners:
+            return
+
+        params = params or EventResponse(Time.now())
+        for listener in listeners:
+            listener._ping(params)
 
     @classmethod
     def listen(cls, event: str | Events, func: Callable[[], None] | Callable[[Any], None]):
@@ -250,11 +276,15 @@ class Listener:
     """The function called when the event occurs"""
     registered: cython.bint = cython.declare(cython.bint, visibility="public")  # type: ignore
     """Describes whether the listener is registered"""
+    _checked_callback: object = cython.declare(object)  # type: ignore
+    _takes_params: cython.int = cython.declare(cython.int)  # type: ignore
 
     def __init__(self, event: str, callback: Callable):
         self.event = event
         self.callback = callback
         self.registered = False
+        self._checked_callback = None
+        self._takes_params = -1
 
     def _ping(self, params: Any):
         """
@@ -263,10 +293,20 @@ class Listener:
         Args:
             params: The event parameters (usually a dictionary)
         """
-        try:
+        # the callback is public, so check it again whenever it is replaced
+        if self.callback is not self._checked_callback:
+            self._checked_callback = self.callback
+            self._takes_params = _callback_arity(self.callback)
+
+        if self._takes_params == 1:
             self.callback(params)  # type: ignore
-        except TypeError:
+        elif self._takes_params == 0:
             self.callback()  # type: ignore
+        else:
+            try:
+                self.callback(params)  # type: ignore
+            except TypeError:
+                self.callback()  # type: ignore
 
     def remove(self):
         """
@@ -285,3 +325,22 @@ class Listener:
                 raise ValueError("Listener not registered")
         except ValueError as e:
             raise ValueError("Listener not registered") from e
+
+
+def _callback_arity(callback: Callable) -> int:
+    """
+    Checks once whether a listener callback accepts the event parameters,
+    so that pinging it doesn't need to catch a TypeError every time.
+
+    Returns:
+        1 if it takes them, 0 if it takes no arguments and -1 if its signature can't be read.
+    """
+    try:
+        sig = inspect.signature(callback)
+    except (TypeError, ValueError):
+        return -1
+    try:
+        sig.bind(None)
+    except TypeError:
+        return 0
+    return 1
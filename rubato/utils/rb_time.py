@@ -132,8 +132,9 @@ class Time:
     def frame_start(cls) -> float:
         """
         Time from the start of the game to the start of the current frame, in seconds.
+        This is read once per frame, so prefer it over :meth:`now` when the exact time within the frame doesn't matter.
         """
-        return cls._frame_start * 1000
+        return cls._frame_start / 1000
 
     @classmethod
     def _now(cls) -> int:
@@ -151,15 +152,21 @@ class Time:
 
     @classmethod
     def _end_frame(cls):
-        if Time.target_fps != 0:
-            delay = cls._normal_delta + cls._frame_start - cls._now()
+        # each tick read is a ctypes call, so only re-read it after actually sleeping
+        start = cls._frame_start
+        now = sdl2.SDL_GetTicks64()
+
+        if cls.target_fps != 0:
+            delay = cls._normal_delta + start - now
             if delay > 0:
                 sdl2.SDL_Delay(delay)
+                now = sdl2.SDL_GetTicks64()
 
-        while cls._now() == cls._frame_start:
+        while now == start:
             sdl2.SDL_Delay(1)
+            now = sdl2.SDL_GetTicks64()
 
-        cls._delta_time = cls._now() - cls._frame_start
+        cls._delta_time = now - start
 
     @classmethod
     def next_frame(cls, func: Callable[[], None]):
@@ -253,8 +260,11 @@ class Time:
             else:
                 break
 
+        # read the clock once for both queues, tasks run this frame are all due at the same time
+        now = cls.now()
+
         while cls._task_queue:
-            if cls._task_queue[0].next_run <= cls.now():
+            if cls._task_queue[0].next_run <= now:
                 delayed_task: DelayedTask = heapq.heappop(cls._task_queue)
                 if not delayed_task.is_stopped:
                     delayed_task.task()
@@ -262,7 +272,7 @@ class Time:
                 break
 
         while cls._recurrent_queue:
-            if cls._recurrent_queue[0].next_run <= cls.now():
+            if cls._recurrent_queue[0].next_run <= now:
                 recurrent_task: RecurrentTask = heapq.heappop(cls._recurrent_queue)
 
                 if not recurrent_task.is_stopped:
@@ -44,8 +44,33 @@ class Camera:
         Returns:
             The translated coordinates.
         """
-        return Vector((point[0] - self.pos.x) * self.zoom + Display.center.x,
-                      (point[1] - self.pos.y) * self.zoom + Display.center.y)
+        return Vector(*self._transform(point))
+
+    def _transform(self, point: Vector | tuple[float, float]) -> tuple[float, float]:
+        """
+        Same as transform but returns a tuple instead of allocating a new Vector. Used internally when drawing.
+        The screen center is the origin of the cartesian space, so no offset is added.
+        """
+        zoom, pos = self._zoom, self.pos
+        return (point[0] - pos.x) * zoom, (point[1] - pos.y) * zoom
+
+    def aabb_visible(self, bottom_left: Vector | tuple[float, float], top_right: Vector | tuple[float, float]) -> bool:
+        """
+        Checks whether an axis-aligned box is at least partially visible through the camera.
+
+        Args:
+            bottom_left: The bottom left corner of the box (world space).
+            top_right: The top right corner of the box (world space).
+
+        Returns:
+            Whether any part of the box is on screen.
+        """
+        half_w, half_h = Display._half_res[0] / self._zoom, Display._half_res[1] / self._zoom
+        pos = self.pos
+        return not (
+            top_right[0] < pos.x - half_w or bottom_left[0] > pos.x + half_w or top_right[1] < pos.y - half_h or
+            bottom_left[1] > pos.y + half_h
+        )
 
     def i_transform(self, point: Vector | tuple[float, float]) -> Vector:
         """
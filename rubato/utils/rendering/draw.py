@@ -1,7 +1,8 @@
 """A static class for drawing things directly to the window."""
 from __future__ import annotations
 from typing import Optional, Callable, TYPE_CHECKING
-import cython, math
+from operator import attrgetter
+import cython, math, ctypes, array
 
 import sdl2, sdl2.ext
 
@@ -16,22 +17,31 @@ if TYPE_CHECKING:
 class _DrawTask:
     priority: int = cython.declare(int, visibility="public")  # type: ignore
     func: Callable = cython.declare(object, visibility="public")  # type: ignore
+    args: tuple = cython.declare(tuple, visibility="public")  # type: ignore
 
-    def __init__(self, priority: int, func: Callable):
+    def __init__(self, priority: int, func: Callable, args: tuple):
         self.priority = priority
         self.func = func
+        self.args = args
 
 
 # THIS IS A STATIC CLASS
 class Draw:
     """A static class allowing drawing items to the window."""
     _queue: list[_DrawTask] = []
+    _task_pool: list[_DrawTask] = []
+    _queue_sorted: bool = True
+    _queue_last_z: float = -Math.INF
 
-    _pt_surfs: dict[Color, Surface] = {}
+    # the caches are keyed by color tuples rather than Color objects, since a Color can be changed after it was used
+    _pt_surfs: dict[tuple[int, int, int, int], Surface] = {}
     _line_surfs: dict[tuple, Surface] = {}
     _rect_surfs: dict[tuple, Surface] = {}
     _circle_surfs: dict[tuple, Surface] = {}
     _poly_surfs: dict[tuple, Surface] = {}
+    _text_surfs: dict[tuple, Surface] = {}
+    _text_cache_size: int = 256
+    _shadow_color: Color = Color(a=200)
 
     def __init__(self) -> None:
         raise InitError(self)
@@ -79,28 +89,76 @@ class Draw:
         )
 
     @classmethod
-    def _push(cls, z_index: int, callback: Callable):
+    def _push(cls, z_index: int, callback: Callable, *args):
         """
         Add a custom draw function to the frame queue.
 
         Args:
             z_index: The z_index to call at (lower z_indexes get called first).
             callback: The function to call.
-        """
-        cls._queue.append(_DrawTask(z_index, callback))
+            *args: The arguments to call the function with.
+        """
+        if z_index < cls._queue_last_z:
+            cls._queue_sorted = False
+        cls._queue_last_z = z_index
+        if cls._task_pool:
+            task: _DrawTask = cls._task_pool.pop()
+            task.priority = z_index
+            task.func = callback
+            task.args = args
+        else:
+            task = _DrawTask(z_index, callback, args)
+        cls._queue.append(task)
+
+    @staticmethod
+    def _off_camera(camera: Camera | None, pos: Vector | tuple[float, float], half_w: float, half_h: float) -> bool:
+        """Whether a box of the given half extents around pos is entirely outside of the camera's view."""
+        if camera is None:
+            return False
+        x: float = pos[0]
+        y: float = pos[1]
+        return not camera.aabb_visible((x - half_w, y - half_h), (x + half_w, y + half_h))
 
     @classmethod
     def _dump(cls):
         """Draws all queued items. Is called automatically at the end of every frame."""
-        if not cls._queue:
-            return
-
-        cls._queue.sort(key=lambda x: x.priority)
-
-        for task in cls._queue:
-            task.func()
-
-        cls._queue.clear()
+        i: int
+        j: int
+        count: int
+        task: _DrawTask
+        # tasks pushed by a callback while drawing land in a fresh queue, which is drawn right after this one
+        while cls._queue:
+            queue = cls._queue
+            # tasks pushed in z order (e.g. everything at the same z_index) don't need sorting
+            if not cls._queue_sorted:
+                queue.sort(key=attrgetter("priority"))
+            cls._queue = []
+            cls._queue_sorted = True
+            cls._queue_last_z = -Math.INF
+
+            count = len(queue)
+            i = 0
+            while i < count:
+                task = queue[i]
+                if task.func is Draw._solid_rect:
+                    # consecutive solid rectangles of the same color are filled with a single SDL call
+                    fill = task.args[3]
+                    j = i + 1
+                    while j < count and queue[j].func is Draw._solid_rect and (
+                        queue[j].args[3] is fill or queue[j].args[3] == fill
+                    ):
+                        j += 1
+                    cls._fill_rects([queue[k].args for k in range(i, j)])
+                    i = j
+                else:
+                    task.func(*task.args)
+                    i += 1
+
+            for task in queue:
+                # drop the references so the pooled task doesn't keep the drawn objects alive
+                task.func = None
+                task.args = ()
+            cls._task_pool.extend(queue)
 
     @classmethod
     def queue_pixel(
@@ -121,7 +179,7 @@ class Draw:
         """
         if camera is not None and camera.z_index < z_index:
             return
-        cls._push(z_index, lambda: cls.pixel(pos, color, camera))
+        cls._push(z_index, cls.pixel, pos, color, camera)
 
     @classmethod
     def pixel(cls, pos: Vector | tuple[float, float], color: Color = Color.cyan, camera: Camera | None = None):
@@ -133,12 +191,29 @@ class Draw:
             color: The color to use for the pixel. Defaults to Color.cyan.
             camera: The camera to use. Defaults to None.
         """
-        if (surf := cls._pt_surfs.get(color, None)) is None:
+        cls._surface(cls._pt_surf(color), pos, (1, 1), 0, camera)
+
+    @classmethod
+    def _pt_surf(cls, color: Color) -> Surface:
+        """Gets the cached 1x1 surface of a color, creating it if needed."""
+        hashing = color.to_tuple()
+
+        if (surf := cls._pt_surfs.get(hashing, None)) is None:
             surf = Surface(1, 1)
             surf.set_pixel((0, 0), color)
-            cls._pt_surfs[color] = surf
+            cls._pt_surfs[hashing] = surf
 
-        cls.surface(surf, pos, camera)
+        return surf
+
+    @classmethod
+    def _prewarm(cls):
+        """
+        Creates the point surfaces of all the named colors, so that the first frames drawing them don't stall.
+        Called automatically by rubato.init once there is a renderer.
+        """
+        for rgb in (*Color._color_defaults.values(), *Color._grayscale_defaults.values()):
+            cls._pt_surf(Color(*rgb))
+        cls._pt_surf(Color.debug)
 
     @classmethod
     def queue_line(
@@ -163,7 +238,7 @@ class Draw:
         """
         if camera is not None and camera.z_index < z_index:
             return
-        cls._push(z_index, lambda: cls.line(p1, p2, color, width, camera))
+        cls._push(z_index, cls.line, p1, p2, color, width, camera)
 
     @staticmethod
     def line(
@@ -183,23 +258,24 @@ class Draw:
             width: The width of the line. Defaults to 1.
             camera: The camera to use. Defaults to None.
         """
-        dims = Vector.create(p2) - p1
-        hashing = dims, color, width
+        dx: float = p2[0] - p1[0]
+        dy: float = p2[1] - p1[1]
+        pad = round(width)
+        hashing = dx, dy, color.to_tuple(), width
 
         if (surf := Draw._line_surfs.get(hashing, None)) is None:
-            pad = round(width)
-            sizex, sizey = abs(round(dims.x)), abs(round(dims.y))
+            sizex, sizey = abs(round(dx)), abs(round(dy))
             halfx, halfy = sizex / 2, sizey / 2
             surf = Surface(sizex + (2 * pad), sizey + (2 * pad))
             surf.draw_line(
-                (halfx * Math.sign(-dims.x), halfy * Math.sign(-dims.y)),
-                (halfx * Math.sign(dims.x), halfy * Math.sign(dims.y)),
+                (halfx * Math.sign(-dx), halfy * Math.sign(-dy)),
+                (halfx * Math.sign(dx), halfy * Math.sign(dy)),
                 color,
-                thickness=round(width),
+                thickness=pad,
             )
             Draw._line_surfs[hashing] = surf
 
-        Draw.surface(surf, p1 + dims / 2 + round(width), camera)
+        Draw._surface(surf, (p1[0] + dx / 2 + pad, p1[1] + dy / 2 + pad), (1, 1), 0, camera)
 
     @classmethod
     def queue_rect(
@@ -230,7 +306,79 @@ class Draw:
         """
         if camera is not None and camera.z_index < z_index:
             return
-        cls._push(z_index, lambda: cls.rect(center, width, height, border, border_thickness, fill, angle, camera))
+        # the half diagonal covers the rectangle at any angle
+        reach = math.hypot(width, height) / 2 + border_thickness
+        if cls._off_camera(camera, center, reach, reach):
+            return
+        # translucent fills stay on the texture path, since SDL blends fills with slightly different rounding
+        if border is None and fill is not None and fill.a == 255 and angle == 0 and width > 0 and height > 0:
+            cls._push(z_index, Draw._solid_rect, center, width, height, fill, camera)
+        else:
+            cls._push(z_index, cls.rect, center, width, height, border, border_thickness, fill, angle, camera)
+
+    @staticmethod
+    def _solid_rect(
+        center: Vector | tuple[float, float],
+        width: int | float,
+        height: int | float,
+        fill: Color,
+        camera: Camera | None = None,
+    ):
+        """
+        Draws an unrotated, borderless rectangle of one color immediately.
+        Queued rectangles like this are batched together by _dump instead of being called one by one.
+        """
+        Draw._fill_rects([(center, width, height, fill, camera)])
+
+    @staticmethod
+    def _fill_rects(rects: list[tuple]):
+        """Fills the arguments of several _solid_rect calls that share a fill color in one go."""
+        count: int = len(rects)
+        half_w: float = Display._half_res[0]
+        half_h: float = Display._half_res[1]
+
+        # queued shapes nearly always share one camera, so only read its state when it changes
+        last_camera: Camera | None = None
+        zoom: float = 1
+        cam_x: float = 0
+        cam_y: float = 0
+        x: float
+        y: float
+
+        # the same rounding as drawing a cached rect surface through Display._update
+        coords: list[int] = []
+        for center, width, height, _, camera in rects:
+            x, y = center[0], center[1]
+            x_dim, y_dim = round(width), round(height)
+            if camera is not None:
+                if camera is not last_camera:
+                    last_camera = camera
+                    zoom, cam_x, cam_y = camera._zoom, camera.pos.x, camera.pos.y
+                x, y = (x - cam_x) * zoom, (y - cam_y) * zoom
+                x_dim, y_dim = round(x_dim * zoom), round(y_dim * zoom)
+            coords.extend((round(x + half_w - x_dim / 2), round(half_h - y - y_dim / 2), x_dim, y_dim))
+
+        # an SDL_Rect is four C ints, so the flat int buffer can be passed as the rect array as is
+        buf = array.array("i", coords)
+        sdl_rects = ctypes.cast(buf.buffer_info()[0], ctypes.POINTER(sdl2.SDL_Rect))
+
+        # the renderer's draw state is shared, so it is put back the way it was found
+        renderer = Display.renderer.sdlrenderer
+        r, g, b, a = ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8()
+        blend_mode = sdl2.SDL_BlendMode()
+        sdl2.SDL_GetRenderDrawColor(renderer, r, g, b, a)
+        sdl2.SDL_GetRenderDrawBlendMode(renderer, blend_mode)
+
+        # like the other queued draws, the color is read when the queue is drawn rather than when it was queued
+        fill: tuple[int, int, int, int] = rects[0][3].to_tuple()
+        sdl2.SDL_SetRenderDrawColor(renderer, *fill)
+        sdl2.SDL_SetRenderDrawBlendMode(
+            renderer, sdl2.SDL_BLENDMODE_NONE if fill[3] == 255 else sdl2.SDL_BLENDMODE_BLEND
+        )
+        sdl2.SDL_RenderFillRects(renderer, sdl_rects, count)
+
+        sdl2.SDL_SetRenderDrawColor(renderer, r.value, g.value, b.value, a.value)
+        sdl2.SDL_SetRenderDrawBlendMode(renderer, blend_mode.value)
 
     @classmethod
     def rect(
@@ -260,7 +408,13 @@ class Draw:
         Raises:
             ValueError: If the width and height are not positive.
         """
-        hashing = width, height, border, border_thickness, fill
+        hashing = (
+            width,
+            height,
+            border.to_tuple() if border is not None else None,
+            border_thickness,
+            fill.to_tuple() if fill is not None else None,
+        )
 
         if width <= 0 or height <= 0:
             raise ValueError("Width and height must be positive.")
@@ -271,8 +425,8 @@ class Draw:
             surf.draw_rect((0, 0), (width, height), border, pad, fill)
             cls._rect_surfs[hashing] = surf
 
-        surf.rotation = angle
-        cls.surface(surf, center, camera)
+        # the cached surface is shared by every rect of this size, so the angle is passed instead of set on it
+        cls._surface(surf, center, (1, 1), angle, camera)
 
     @classmethod
     def queue_circle(
@@ -299,7 +453,10 @@ class Draw:
         """
         if camera is not None and camera.z_index < z_index:
             return
-        cls._push(z_index, lambda: cls.circle(center, radius, border, border_thickness, fill, camera))
+        reach = radius + border_thickness + 1
+        if cls._off_camera(camera, center, reach, reach):
+            return
+        cls._push(z_index, cls.circle, center, radius, border, border_thickness, fill, camera)
 
     @classmethod
     def circle(
@@ -325,7 +482,12 @@ class Draw:
         Raises:
             ValueError: If the radius is not positive.
         """
-        hashing = radius, border, border_thickness, fill
+        hashing = (
+            radius,
+            border.to_tuple() if border is not None else None,
+            border_thickness,
+            fill.to_tuple() if fill is not None else None,
+        )
 
         if radius <= 0:
             raise ValueError("Radius must be positive.")
@@ -336,7 +498,7 @@ class Draw:
             surf.draw_circle((0, 0), round(radius), border, round(border_thickness), fill)
             cls._circle_surfs[hashing] = surf
 
-        cls.surface(surf, center, camera)
+        cls._surface(surf, center, (1, 1), 0, camera)
 
     @classmethod
     def queue_poly(
@@ -363,7 +525,14 @@ class Draw:
         """
         if camera is not None and camera.z_index < z_index:
             return
-        cls._push(z_index, lambda: cls.poly(points, center, border, border_thickness, fill, camera))
+        if camera is not None:
+            reach_x, reach_y = 0, 0
+            for point in points:
+                reach_x = max(reach_x, abs(point[0]))
+                reach_y = max(reach_y, abs(point[1]))
+            if cls._off_camera(camera, center, reach_x + border_thickness + 1, reach_y + border_thickness + 1):
+                return
+        cls._push(z_index, cls.poly, points, center, border, border_thickness, fill, camera)
 
     @classmethod
     def poly(
@@ -386,22 +555,37 @@ class Draw:
             fill: The fill color. Defaults to None.
             camera: The camera to use. Defaults to None.
         """
-        hashing = tuple(points), border, border_thickness, fill
+        hashing = (
+            tuple(points),
+            border.to_tuple() if border is not None else None,
+            border_thickness,
+            fill.to_tuple() if fill is not None else None,
+        )
 
         if (surf := cls._poly_surfs.get(hashing, None)) is None:
-            min_x, min_y = Math.INF, Math.INF
-            max_x, max_y = -Math.INF, -Math.INF
+            # typed so that the bounding box scan compiles to plain C comparisons
+            min_x: float = Math.INF
+            min_y: float = Math.INF
+            max_x: float = -Math.INF
+            max_y: float = -Math.INF
+            x: float
+            y: float
             for point in points:
-                min_x = min(min_x, point[0])
-                min_y = min(min_y, point[1])
-                max_x = max(max_x, point[0])
-                max_y = max(max_y, point[1])
+                x, y = point[0], point[1]
+                if x < min_x:
+                    min_x = x
+                if x > max_x:
+                    max_x = x
+                if y < min_y:
+                    min_y = y
+                if y > max_y:
+                    max_y = y
             pad = round(border_thickness) if border is not None else 0
             surf = Surface(pad * 2 + round(max_x - min_x + 2), pad * 2 + round(max_y - min_y + 2))
             surf.draw_poly(points, (0, 0), border, round(border_thickness), fill)
             cls._poly_surfs[hashing] = surf
 
-        cls.surface(surf, center, camera)
+        cls._surface(surf, center, (1, 1), 0, camera)
 
     @classmethod
     def queue_text(
@@ -438,9 +622,7 @@ class Draw:
         """
         if camera is not None and camera.z_index < z_index:
             return
-        cls._push(
-            z_index, lambda: cls.text(text, font, pos, justify, align, width, scale, shadow, shadow_pad, af, camera)
-        )
+        cls._push(z_index, cls.text, text, font, pos, justify, align, width, scale, shadow, shadow_pad, af, camera)
 
     @classmethod
     def text(
@@ -476,33 +658,52 @@ class Draw:
         shadow_pad = Vector.create(shadow_pad)
 
         if camera is not None:
-            pos = camera.transform(pos)
-            scale = camera.zoom * scale[0], camera.zoom * scale[1]
-            shadow_pad = camera.zoom * shadow_pad
-
-        surf = font._generate(text, justify, width)
-        tx = Surface._from_surf(surf, scale=scale, af=af)
-        sdl2.SDL_FreeSurface(surf)
+            zoom: float = camera._zoom
+            pos = camera._transform(pos)
+            scale = zoom * scale[0], zoom * scale[1]
+            shadow_pad = zoom * shadow_pad
 
         pad_x, pad_y = (shadow_pad / scale).tuple_int()
 
-        if shadow:
-            tx_dims = tx.width + 2 * pad_x, font.size + 2 * pad_y
-            final_tx = Surface(*tx_dims, scale=scale)
-            final_tx.fill(Color(a=200))
-            final_tx.blit(
-                tx,
-                (0, 0, tx.width, font.size),
-            )
-        else:
-            final_tx = tx
+        hashing = (
+            text,
+            font._font_path,
+            font._size,
+            font._styles,
+            font._color.to_tuple(),
+            justify,
+            width,
+            af,
+            (pad_x, pad_y) if shadow else None,
+        )
 
-        size = final_tx.size_scaled()
+        # popping and reinserting keeps the dict in least to most recently used order
+        if (final_tx := cls._text_surfs.pop(hashing, None)) is None:
+            surf = font._generate(text, justify, width)
+            tx = Surface._from_surf(surf, af=af)
+            sdl2.SDL_FreeSurface(surf)
+
+            if shadow:
+                tx_dims = tx.width + 2 * pad_x, font.size + 2 * pad_y
+                final_tx = Surface(*tx_dims)
+                final_tx.draw_rect((0, 0), tx_dims, fill=cls._shadow_color, blending=False)
+                final_tx.blit(
+                    tx,
+                    (0, 0, tx.width, font.size),
+                )
+            else:
+                final_tx = tx
+
+            if len(cls._text_surfs) >= cls._text_cache_size:
+                del cls._text_surfs[next(iter(cls._text_surfs))]
+        cls._text_surfs[hashing] = final_tx
+
+        # the cached surface is shared, so the scale is passed along instead of set on it
         center = (
-            pos[0] + (align[0] * size[0]) / 2,
-            pos[1] - (align[1] * size[1]) / 2,
+            pos[0] + (align[0] * final_tx._width * scale[0]) / 2,
+            pos[1] - (align[1] * final_tx._height * scale[1]) / 2,
         )
-        cls.surface(final_tx, center, camera)
+        cls._surface(final_tx, center, scale, 0, camera)
 
     @classmethod
     def queue_surface(
@@ -523,7 +724,11 @@ class Draw:
         """
         if camera is not None and camera.z_index < z_index:
             return
-        cls._push(z_index, lambda: cls.surface(surface, pos, camera))
+        # the half diagonal covers the surface at any rotation
+        reach = math.hypot(surface._width * surface.scale[0], surface._height * surface.scale[1]) / 2
+        if cls._off_camera(camera, pos, reach, reach):
+            return
+        cls._push(z_index, cls.surface, surface, pos, camera)
 
     @classmethod
     def surface(cls, surface: Surface, pos: Vector | tuple[float, float] = (0, 0), camera: Camera | None = None):
@@ -535,16 +740,30 @@ class Draw:
             pos: The position to draw the surface at. Defaults to (0, 0).
             camera: The camera to use. Defaults to None.
         """
-        if not surface.uptodate:
+        cls._surface(surface, pos, surface.scale, surface.rotation, camera)
+
+    @staticmethod
+    def _surface(
+        surface: Surface,
+        pos: Vector | tuple[float, float],
+        scale: Vector | tuple[float, float],
+        rotation: float,
+        camera: Camera | None = None,
+    ):
+        """
+        Draws a surface immediately with the given scale and rotation instead of the surface's own.
+        This lets many draws share one surface without mutating it.
+        """
+        # read the fields directly, this runs for every queued surface every frame
+        if not surface._uptodate:
             surface._regen()
 
         if camera is not None:
-            pos = camera.transform(pos)
-            scale = camera.zoom * surface.scale
-        else:
-            scale = surface.scale
+            zoom: float = camera._zoom
+            pos = camera._transform(pos)
+            scale = zoom * scale[0], zoom * scale[1]
 
-        Display._update(surface._tx, surface.width, surface.height, pos, scale, surface.rotation)
+        Display._update(surface._tx, surface._width, surface._height, pos, scale, rotation)
 
     @classmethod
     def clear_cache(cls):
@@ -560,6 +779,8 @@ class Draw:
         cls._rect_surfs.clear()
         cls._circle_surfs.clear()
         cls._poly_surfs.clear()
+        cls._text_surfs.clear()
+        cls._task_pool.clear()
 
     @classmethod
     def _cache_size(cls):
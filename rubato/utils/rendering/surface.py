@@ -47,11 +47,39 @@ class Surface:
         sdl2.SDL_SetTextureBlendMode(self._tx, sdl2.SDL_BLENDMODE_BLEND)
         self._pixels: int = c_draw.create_pixel_buffer(width, height)
         self._pixels_colorkey: int = 0
-        self.uptodate: bool = False
+        self._uptodate: bool = False
+        self._dirty: tuple[int, int, int, int] | None = None
+        """The only area (x1, y1, x2, y2) that changed since the last regen. None means the whole surface."""
+
+    @property
+    def uptodate(self) -> bool:
         """
         Whether the texture is up to date with the surface.
         Can be set to False to trigger a texture regeneration at the next draw cycle.
         """
+        return self._uptodate
+
+    @uptodate.setter
+    def uptodate(self, new: bool):
+        self._uptodate = new
+        self._dirty = None
+
+    def _mark_dirty(self, x1: int, y1: int, x2: int, y2: int):
+        """
+        Marks an area (in surface space, x2 and y2 exclusive) as changed, so that only that area is sent to the
+        texture at the next regen.
+        """
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, self._width), min(y2, self._height)
+        if x1 >= x2 or y1 >= y2:
+            return
+
+        if self._uptodate:
+            self._uptodate = False
+            self._dirty = (x1, y1, x2, y2)
+        elif self._dirty is not None:
+            d = self._dirty
+            self._dirty = (min(d[0], x1), min(d[1], y1), max(d[2], x2), max(d[3], y2))
 
     @property
     def width(self) -> int:
@@ -185,9 +213,17 @@ class Surface:
         if self._color_key is not None:
             c_draw.colorkey_copy(self._pixels, self._pixels_colorkey, self._width, self._height, self._color_key)
 
-        sdl2.SDL_UpdateTexture(
-            self._tx, None, self._pixels if self._color_key is None else self._pixels_colorkey, self.width * 4
-        )
+        pixels = self._pixels if self._color_key is None else self._pixels_colorkey
+        if self._dirty is None:
+            sdl2.SDL_UpdateTexture(self._tx, None, pixels, self._width * 4)
+        else:
+            x1, y1, x2, y2 = self._dirty
+            sdl2.SDL_UpdateTexture(
+                self._tx,
+                sdl2.SDL_Rect(x1, y1, x2 - x1, y2 - y1),
+                pixels + (y1 * self._width + x1) * 4,
+                self._width * 4,
+            )
         self.uptodate = True
 
     def clear(self):
@@ -243,7 +279,29 @@ class Surface:
         cart_pos = self._convert_to_surface_space(pos)
         x, y = round(cart_pos[0]), round(cart_pos[1])
         c_draw.set_pixel(self._pixels, self._width, self._height, x, y, color.argb32(), blending)
-        self.uptodate = False
+        self._mark_dirty(x, y, x + 1, y + 1)
+
+    def set_pixels(
+        self,
+        points: list[Vector] | list[tuple[float, float]],
+        color: Color = Color.black,
+        blending: bool = True,
+    ):
+        """
+        Draws many points of the same color on the surface in a single call.
+        Much faster than calling set_pixel for each point.
+
+        Args:
+            points: The positions of the points.
+            color: The color of the points. Defaults to black.
+            blending: Whether to use blending. Defaults to True.
+        """
+        hw, hh = self._width / 2, self._height / 2
+        xs = [round(p[0] + hw) for p in points]
+        ys = [round(hh - p[1]) for p in points]
+        c_draw.set_pixels(self._pixels, self._width, self._height, xs, ys, color.argb32(), blending)
+        if xs:
+            self._mark_dirty(min(xs), min(ys), max(xs) + 1, max(ys) + 1)
 
     def draw_line(
         self,
@@ -272,7 +330,12 @@ class Surface:
         c_draw.draw_line(
             self._pixels, self._width, self._height, sx, sy, ex, ey, color.argb32(), aa, blending, thickness
         )
-        self.uptodate = False
+        self._mark_dirty(
+            min(sx, ex) - thickness - 1,
+            min(sy, ey) - thickness - 1,
+            max(sx, ex) + thickness + 2,
+            max(sy, ey) + thickness + 2,
+        )
 
     def draw_rect(
         self,
@@ -310,7 +373,8 @@ class Surface:
             blending,
             border_thickness,
         )
-        self.uptodate = False
+        pad = border_thickness + 1
+        self._mark_dirty(x - pad, y - pad, x + w + pad, y + h + pad)
 
     def draw_circle(
         self,
@@ -349,7 +413,8 @@ class Surface:
             blending,
             border_thickness,
         )
-        self.uptodate = False
+        pad = radius + border_thickness + 1
+        self._mark_dirty(x - pad, y - pad, x + pad + 1, y + pad + 1)
 
     def draw_poly(
         self,
@@ -373,8 +438,11 @@ class Surface:
             aa: Whether to use anti-aliasing. Defaults to False.
             blending: Whether to use blending. Defaults to False.
         """
+        if not points:
+            return
+
         center_pos = self._convert_to_surface_space(center)
-        c_draw.draw_poly(
+        x1, y1, x2, y2 = c_draw.draw_poly(
             self._pixels,
             center_pos,
             self._width,
@@ -386,7 +454,8 @@ class Surface:
             blending,
             border_thickness,
         )
-        self.uptodate = False
+        pad = border_thickness + 1
+        self._mark_dirty(x1 - pad, y1 - pad, x2 + pad + 1, y2 + pad + 1)
 
     def switch_color(self, color: Color, new_color: Color):
         """
@@ -435,8 +504,11 @@ class Surface:
             rotation=self.rotation,
             af=self.af,
         )
-        new.blit(self)
-        new._pixels_colorkey = self._pixels_colorkey
+        # same size and format, so the pixels can be copied over in one go
+        c_draw.free_pixel_buffer(new._pixels)
+        new._pixels = c_draw.clone_pixel_buffer(self._pixels, self._width, self._height)
+        if self._pixels_colorkey != 0:
+            new._pixels_colorkey = c_draw.clone_pixel_buffer(self._pixels_colorkey, self._width, self._height)
         new._color_key = self._color_key
         new.set_alpha(self.get_alpha())
 
@@ -592,3 +664,5 @@ class Surface:
     def __del__(self):
         sdl2.SDL_DestroyTexture(self._tx)
         c_draw.free_pixel_buffer(self._pixels)
+        if self._pixels_colorkey != 0:
+            c_draw.free_pixel_buffer(self._pixels_colorkey)
@@ -20,7 +20,7 @@ setup(
             Extension(
                 "rubato.c_src.c_draw",
                 ["rubato/c_src/c_draw.py", "rubato/c_src/cdraw.cpp"],
-                extra_compile_args=["-std=c++14"],
+                extra_compile_args=["-std=c++14", "-O3"],
                 language="c++",
             ),
         ),
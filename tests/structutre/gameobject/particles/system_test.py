@@ -0,0 +1,55 @@
+"""Tests for the ParticleSystem class"""
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.particles.system import ParticleSystem, ParticleSystemMode
+from rubato.utils.computation.vector import Vector
+
+
+def test_burst(rub):
+    # pylint: disable=unused-argument
+    system = ParticleSystem(mode=ParticleSystemMode.BURST, spread=90, max_particles=3, local_space=False, running=True)
+    GameObject(pos=Vector(10, 20), rotation=45).add(system)
+    system.fixed_update()
+
+    assert system.num_particles() == 3
+    for particle in system._ParticleSystem__particles:
+        assert particle._system_pos == Vector(10, 20)
+        assert particle._system_rotation == 45
+
+    system.fixed_update()
+    assert system.num_particles() == 3
+
+
+def test_burst_overridden_gen_particle(rub):
+    # pylint: disable=unused-argument
+    class CountingSystem(ParticleSystem):
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.angles = []
+
+        def gen_particle(self, angle: float):
+            self.angles.append(angle)
+            super().gen_particle(angle)
+
+    system = CountingSystem(mode=ParticleSystemMode.BURST, spread=90, running=True)
+    GameObject().add(system)
+    system.fixed_update()
+
+    assert system.angles == [0, 90, 180, 270]
+    assert system.num_particles() == 4
+
+
+def test_burst_overridden_gen_particle_limits(rub):
+    # pylint: disable=unused-argument
+    class PairSystem(ParticleSystem):
+
+        def gen_particle(self, angle: float):
+            super().gen_particle(angle)
+            super().gen_particle(angle + 1)
+
+    system = PairSystem(mode=ParticleSystemMode.BURST, spread=90, max_particles=3, running=True)
+    GameObject().add(system)
+    system.fixed_update()
+
+    # the limits are checked before every call, so generation stops as soon as max_particles is reached
+    assert system.num_particles() == 4
@@ -0,0 +1,47 @@
+"""Tests for the QuadTree broad phase"""
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.physics.hitbox import Circle
+from rubato.structure.gameobject.physics.qtree import _QTree
+from rubato.utils.computation.vector import Vector
+
+
+def test_separating_pair(rub):
+    # pylint: disable=unused-argument
+    events = []
+    checks = []
+
+    def should_collide(a, b):
+        checks.append((a, b))
+        return True
+
+    def make(name: str, pos: Vector) -> Circle:
+        hb = Circle(
+            10,
+            trigger=True,
+            should_collide=should_collide,
+            on_enter=lambda _: events.append(("enter", name)),
+            on_exit=lambda _: events.append(("exit", name)),
+        )
+        GameObject(pos=pos).add(hb)
+        return hb
+
+    a = make("a", Vector(0, 0))
+    b = make("b", Vector(15, 0))
+
+    _QTree([[a], [b]])
+    assert sorted(events) == [("enter", "a"), ("enter", "b")]
+    assert b in a.colliding and a in b.colliding
+
+    # the bounding boxes stop overlapping, but the pair was touching so on_exit still has to fire
+    events.clear()
+    b.gameobj.pos = Vector(100, 0)
+    _QTree([[a], [b]])
+    assert sorted(events) == [("exit", "a"), ("exit", "b")]
+    assert not a.colliding and not b.colliding
+
+    # now that they are apart, the narrow phase is skipped entirely
+    events.clear()
+    checks.clear()
+    _QTree([[a], [b]])
+    assert not events
+    assert not checks
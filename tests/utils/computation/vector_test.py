@@ -96,6 +96,11 @@ def test_clamp(v1, v34):
     assert v1.clamp(2, 2) == Vector(2, 2)
     assert v34.clamp(1, 2) == Vector(2, 2)
     assert v34.clamp(Vector(1, 4), Vector(2, 4), True) == Vector(2, 4)
+    assert Vector(-3, 4).clamp(-2, 2, True) == Vector(2, 2)
+
+    out = Vector()
+    assert v34.clamp(Vector(0, 0), 3, out=out) is out
+    assert out == Vector(3, 3)
 
 
 def test_rotate(v1):
@@ -167,6 +172,18 @@ def test_from_radial():
 def test_clamp_mag(v34):
     v = Vector.clamp_magnitude(v34, 2)
     assert v.magnitude == 2
+    assert v34.magnitude == 5
+
+    v = Vector.clamp_magnitude(v34, 10, 6)
+    assert v.magnitude == pytest.approx(6)
+    assert Vector.clamp_magnitude(Vector(), 10, 6) == Vector()
+
+
+def test_clamp_mag_xy():
+    assert Vector.clamp_magnitude_xy(3, 4, 10) == (3, 4)
+    x, y = Vector.clamp_magnitude_xy(3, 4, 2)
+    assert x == pytest.approx(1.2)
+    assert y == pytest.approx(1.6)
 
 
 def test_angle_between(v1, v34):
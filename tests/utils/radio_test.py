@@ -28,6 +28,23 @@ def test_listener_ping():
     l._ping({})
     callback.assert_called_once()
 
+    l.callback = mock.Mock()
+    l._ping({"a": 1})
+    l.callback.assert_called_once_with({"a": 1})
+
+
+def test_listener_ping_type_error():
+    calls = []
+
+    def raises(params):
+        calls.append(params)
+        raise TypeError("inside the callback")
+
+    l = Listener("test", raises)
+    with pytest.raises(TypeError, match="inside the callback"):
+        l._ping({})
+    assert calls == [{}]
+
 
 def test_radio_register():
     Radio.listeners = {}
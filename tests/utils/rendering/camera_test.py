@@ -22,3 +22,24 @@ def test_transform(rub):
     c.zoom = 2
     assert c.transform(Vector(0, 0)) == Vector(0, 0)
     assert c.transform(Vector(100, 100)) == Vector(200, 200)
+
+
+def test_transform_tuple(rub):
+    # pylint: disable=unused-argument
+    c = Camera(pos=(10, -20), zoom=2)
+    assert c._transform((10, -20)) == (0, 0)
+    assert c._transform(Vector(20, -10)) == (20, 20)
+    assert c.transform((20, -10)) == Vector(20, 20)
+
+
+def test_aabb_visible(rub):
+    # pylint: disable=unused-argument
+    c = Camera()
+    assert c.aabb_visible((-10, -10), (10, 10))
+    assert c.aabb_visible((190, 90), (250, 150))
+    assert not c.aabb_visible((201, 0), (250, 10))
+    assert not c.aabb_visible((0, -150), (10, -101))
+    c.zoom = 0.5
+    assert c.aabb_visible((201, 0), (250, 10))
+    c.pos = Vector(1000, 0)
+    assert not c.aabb_visible((-10, -10), (10, 10))
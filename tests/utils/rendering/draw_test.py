@@ -0,0 +1,195 @@
+"""Test the Draw class"""
+import ctypes
+import pytest
+import sdl2
+from rubato.utils.color import Color
+from rubato.utils.computation.vector import Vector
+from rubato.utils.rendering.camera import Camera
+from rubato.utils.rendering.draw import Draw
+from rubato.utils.rendering.font import Font
+from rubato.utils.hardware.display import Display
+from rubato.utils.rendering.surface import Surface
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.particles.particle import Particle
+from rubato.structure.gameobject.particles.system import ParticleSystem
+# pylint: disable=redefined-outer-name, unused-argument
+
+
+@pytest.fixture
+def queue(rub):
+    Draw._queue.clear()
+    yield Draw._queue
+    Draw._queue.clear()
+
+
+@pytest.fixture
+def camera(rub):
+    # the 400x200 resolution of the rub fixture, so the view spans x in [-200, 200] and y in [-100, 100]
+    return Camera()
+
+
+def test_queue_rect_cull(queue, camera):
+    Draw.queue_rect((300, 0), 20, 20, camera=camera)
+    Draw.queue_rect((0, 300), 20, 20, fill=Color.red, border=None, camera=camera)
+    assert len(queue) == 0
+
+    Draw.queue_rect((210, 0), 20, 20, camera=camera)
+    Draw.queue_rect((0, -110), 20, 20, fill=Color.red, border=None, camera=camera)
+    Draw.queue_rect((300, 0), 20, 20)
+    assert len(queue) == 3
+
+
+def test_queue_circle_cull(queue, camera):
+    Draw.queue_circle((300, 0), 10, camera=camera)
+    assert len(queue) == 0
+
+    Draw.queue_circle((210, 0), 10, camera=camera)
+    Draw.queue_circle((300, 0), 10)
+    assert len(queue) == 2
+
+
+def test_queue_poly_cull(queue, camera):
+    square = [(-10, -10), (10, -10), (10, 10), (-10, 10)]
+    Draw.queue_poly(square, (300, 0), camera=camera)
+    assert len(queue) == 0
+
+    Draw.queue_poly(square, (210, 0), camera=camera)
+    Draw.queue_poly(square, (300, 0))
+    assert len(queue) == 2
+
+
+def test_queue_surface_cull(queue, camera):
+    surf = Surface(20, 20)
+    Draw.queue_surface(surf, (0, 200), camera=camera)
+    assert len(queue) == 0
+
+    Draw.queue_surface(surf, (0, 110), camera=camera)
+    Draw.queue_surface(surf, (0, 200))
+    assert len(queue) == 2
+
+    # a zoomed out camera sees further
+    camera.zoom = 0.5
+    Draw.queue_surface(surf, (0, 200), camera=camera)
+    assert len(queue) == 3
+
+
+def test_particle_cull(queue, camera):
+    surf = Surface(20, 20)
+    system = ParticleSystem(lambda _: Particle(surf), local_space=True)
+    GameObject().add(system)
+    system._ParticleSystem__particles.extend([Particle(surf, pos=(300, 0)), Particle(surf, pos=(210, 0))])
+
+    system.draw(camera)
+    assert len(queue) == 1
+    assert queue[0].args[1] == Vector(210, 0)
+
+
+def test_dump_runs_tasks_pushed_while_drawing(queue):
+    calls = []
+
+    def inner(name: str):
+        calls.append(name)
+
+    def outer():
+        calls.append("outer")
+        Draw._push(-1, inner, "pushed")
+
+    Draw._push(0, inner, "first")
+    Draw._push(1, outer)
+    Draw._dump()
+
+    assert calls == ["first", "outer", "pushed"]
+    assert not Draw._queue
+    assert all(task.func is None and task.args == () for task in Draw._task_pool)
+
+
+@pytest.fixture
+def text_cache(rub):
+    Draw._text_surfs.clear()
+    yield Draw._text_surfs
+    Draw._text_surfs.clear()
+
+
+def test_text_cache_hit(text_cache):
+    font = Font()
+    Draw.text("hello", font)
+    assert len(text_cache) == 1
+    surf = next(iter(text_cache.values()))
+
+    Draw.text("hello", font, pos=(10, 10), scale=(2, 2))
+    assert len(text_cache) == 1
+    assert next(iter(text_cache.values())) is surf
+
+
+def test_text_cache_miss(text_cache):
+    font = Font()
+    Draw.text("hello", font)
+    font.color = Color.red
+    Draw.text("hello", font)
+    assert len(text_cache) == 2
+
+    # a color changed in place must not hit the entry of its old value
+    font.color.g = 200
+    Draw.text("hello", font)
+    assert len(text_cache) == 3
+
+    Draw.text("hello", Font(size=20))
+    Draw.text("hello", Font(font="Mozart"))
+    Draw.text("hello", font, shadow=True)
+    assert len(text_cache) == 6
+
+
+def test_text_cache_eviction(text_cache):
+    font = Font()
+    for i in range(Draw._text_cache_size):
+        Draw.text(str(i), font)
+    assert Draw._text_cache_size == 256
+    assert len(text_cache) == 256
+
+    # using the oldest entry again makes "1" the least recently used one
+    Draw.text("0", font)
+    Draw.text("new", font)
+    assert len(text_cache) == 256
+    texts = [key[0] for key in text_cache]
+    assert "0" in texts and "new" in texts
+    assert "1" not in texts
+
+
+def test_prewarm(rub):
+    Draw._pt_surfs.clear()
+    Draw._prewarm()
+    for rgb in (*Color._color_defaults.values(), *Color._grayscale_defaults.values()):
+        assert Color(*rgb).to_tuple() in Draw._pt_surfs
+    assert Color.debug.to_tuple() in Draw._pt_surfs
+
+
+def test_fill_rects_restores_renderer_state(rub):
+    renderer = Display.renderer.sdlrenderer
+    sdl2.SDL_SetRenderDrawColor(renderer, 1, 2, 3, 4)
+    sdl2.SDL_SetRenderDrawBlendMode(renderer, sdl2.SDL_BLENDMODE_ADD)
+
+    Draw._solid_rect((0, 0), 10, 10, Color(255, 0, 0))
+    Draw._solid_rect((0, 0), 10, 10, Color(255, 0, 0, 100), Camera())
+
+    r, g, b, a = ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8(), ctypes.c_uint8()
+    blend_mode = sdl2.SDL_BlendMode()
+    sdl2.SDL_GetRenderDrawColor(renderer, r, g, b, a)
+    sdl2.SDL_GetRenderDrawBlendMode(renderer, blend_mode)
+    assert (r.value, g.value, b.value, a.value) == (1, 2, 3, 4)
+    assert blend_mode.value == sdl2.SDL_BLENDMODE_ADD
+
+    sdl2.SDL_SetRenderDrawBlendMode(renderer, sdl2.SDL_BLENDMODE_NONE)
+
+
+def test_queue_rect_reads_fill_when_drawn(queue, monkeypatch):
+    calls = []
+    monkeypatch.setattr(Draw, "_fill_rects", staticmethod(lambda rects: calls.append([r[3].to_tuple() for r in rects])))
+
+    fill = Color(255, 0, 0)
+    Draw.queue_rect((0, 0), 10, 10, border=None, fill=fill)
+    Draw.queue_rect((20, 0), 10, 10, border=None, fill=Color(255, 0, 0))
+    fill.g = 100
+    Draw._dump()
+
+    # the changed color no longer matches the other rect, so the two are filled separately
+    assert calls == [[(255, 100, 0, 255)], [(255, 0, 0, 255)]]
@@ -0,0 +1,95 @@
+"""Test the Surface class"""
+import ctypes
+import sdl2
+from rubato.utils.color import Color
+from rubato.utils.rendering.surface import Surface
+from rubato.utils.hardware.display import Display
+
+
+def read_texture(surf: Surface) -> list[int]:
+    """Draws the texture of a surface onto a target of the same size and reads back its ARGB pixels."""
+    renderer = Display.renderer.sdlrenderer
+    target = sdl2.SDL_CreateTexture(
+        renderer, Display.pixel_format, sdl2.SDL_TEXTUREACCESS_TARGET, surf.width, surf.height
+    )
+    pixels = (ctypes.c_uint32 * (surf.width * surf.height))()
+    sdl2.SDL_SetRenderTarget(renderer, target)
+    sdl2.SDL_SetRenderDrawColor(renderer, 0, 0, 0, 0)
+    sdl2.SDL_RenderClear(renderer)
+    # copy the texels as they are, blending would round them
+    sdl2.SDL_SetTextureBlendMode(surf._tx, sdl2.SDL_BLENDMODE_NONE)
+    sdl2.SDL_RenderCopy(renderer, surf._tx, None, None)
+    sdl2.SDL_SetTextureBlendMode(surf._tx, sdl2.SDL_BLENDMODE_BLEND)
+    sdl2.SDL_RenderReadPixels(renderer, None, Display.pixel_format, pixels, surf.width * 4)
+    sdl2.SDL_SetRenderTarget(renderer, None)
+    sdl2.SDL_DestroyTexture(target)
+    return list(pixels)
+
+
+def test_set_pixels(rub):
+    # pylint: disable=unused-argument
+    surf = Surface(4, 4)
+    surf.set_pixels([(-2, 2), (0, 0), (1, -1)], Color.red, False)
+    assert surf.get_pixel((-2, 2)) == Color.red
+    assert surf.get_pixel((0, 0)) == Color.red
+    assert surf.get_pixel((1, -1)) == Color.red
+    assert surf.get_pixel((-1, 1)) == Color.clear
+
+    # out of bounds points are skipped
+    surf.set_pixels([(10, 10), (-10, -10)], Color.blue, False)
+    assert Color.blue not in [surf.get_pixel((x, y)) for x in range(-2, 2) for y in range(-1, 3)]
+
+    surf.set_pixels([], Color.blue)
+
+
+def test_set_pixels_matches_set_pixel(rub):
+    # pylint: disable=unused-argument
+    points = [(-2, 1), (0, 0), (1, -2)]
+    color = Color(10, 200, 30, 100)
+    for blending in (True, False):
+        bulk, single = Surface(4, 4), Surface(4, 4)
+        bulk.fill(Color.white)
+        single.fill(Color.white)
+        bulk.set_pixels(points, color, blending)
+        for p in points:
+            single.set_pixel(p, color, blending)
+        for x in range(-2, 2):
+            for y in range(-1, 3):
+                assert bulk.get_pixel((x, y)) == single.get_pixel((x, y))
+
+
+def test_partial_regen(rub):
+    # pylint: disable=unused-argument
+    surf = Surface(8, 8)
+    surf.fill(Color.black)
+    surf._regen()
+    assert surf.uptodate
+    assert read_texture(surf) == [Color.black.argb32()] * 64
+
+    surf.set_pixels([(-3, 3), (-2, 2)], Color.red, False)
+    assert not surf.uptodate
+    assert surf._dirty == (1, 1, 3, 3)
+
+    surf._regen()
+    assert surf.uptodate
+    pixels = read_texture(surf)
+    for y in range(8):
+        for x in range(8):
+            expected = Color.red if (x, y) in ((1, 1), (2, 2)) else Color.black
+            assert pixels[y * 8 + x] == expected.argb32()
+
+
+def test_dirty_area_merges(rub):
+    # pylint: disable=unused-argument
+    surf = Surface(8, 8)
+    surf._regen()
+    surf.set_pixel((-4, 4), Color.red)
+    surf.set_pixels([(3, -3)], Color.red)
+    assert surf._dirty == (0, 0, 8, 8)
+
+    surf._regen()
+    surf.set_pixels([(100, 100)], Color.red)
+    assert surf.uptodate
+
+    surf.uptodate = False
+    assert surf._dirty is None